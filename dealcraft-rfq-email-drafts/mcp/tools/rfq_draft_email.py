@@ -5,15 +5,22 @@ Run:
   python mcp/tools/rfq_draft_email.py --sample
 
 Embed as an MCP tool that accepts RFQ fields and creates two Outlook Draft emails via AppleScript.
+From async code (e.g. the MCP server), await create_rfq_drafts_async() instead.
 """
 
 import argparse
+import asyncio
 import json
 import pathlib
 import subprocess
 from dataclasses import asdict, dataclass
 from typing import List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 SCRIPT_PATH = pathlib.Path(__file__).resolve().parents[2] / "scripts" / "create_rfq_drafts.applescript"
 
 
@@ -32,15 +39,36 @@ class RFQ:
     attachments: Optional[List[str]] = None
 
 
-def run_osascript_with_json(payload: dict) -> str:
+def _osascript_command(payload: dict) -> List[str]:
     if not SCRIPT_PATH.exists():
         raise FileNotFoundError(f"AppleScript not found at {SCRIPT_PATH}")
-    json_arg = json.dumps(payload, ensure_ascii=False)
-    cmd = ["osascript", str(SCRIPT_PATH), json_arg]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"osascript failed: {result.stderr.strip()}")
-    return result.stdout.strip()
+    # osascript takes the payload as a str argv; non-JSON values (dates, paths) are stringified
+    if orjson is not None:
+        json_arg = orjson.dumps(payload, default=str).decode()
+    else:
+        json_arg = json.dumps(payload, ensure_ascii=False, default=str)
+    return ["osascript", str(SCRIPT_PATH), json_arg]
+
+
+def _osascript_result(returncode: int, stdout: bytes, stderr: bytes) -> str:
+    # Keep raw bytes and decode once: osascript writes UTF-8 regardless of the caller's locale
+    if returncode != 0:
+        raise RuntimeError(f"osascript failed: {stderr.decode('utf-8', 'replace').strip()}")
+    return stdout.decode("utf-8", "replace").strip()
+
+
+def run_osascript_with_json(payload: dict) -> str:
+    result = subprocess.run(_osascript_command(payload), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return _osascript_result(result.returncode, result.stdout, result.stderr)
+
+
+async def run_osascript_with_json_async(payload: dict) -> str:
+    """Like run_osascript_with_json, without blocking the event loop while Outlook works."""
+    proc = await asyncio.create_subprocess_exec(
+        *_osascript_command(payload), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return _osascript_result(proc.returncode, stdout, stderr)
 
 
 def create_rfq_drafts(rfq: RFQ) -> str:
@@ -48,6 +76,11 @@ def create_rfq_drafts(rfq: RFQ) -> str:
     return run_osascript_with_json(payload)
 
 
+async def create_rfq_drafts_async(rfq: RFQ) -> str:
+    payload = asdict(rfq)
+    return await run_osascript_with_json_async(payload)
+
+
 def _sample_rfq() -> RFQ:
     return RFQ(
         customer="Customer Alpha",
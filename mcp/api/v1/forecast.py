@@ -137,10 +137,14 @@ def get_opportunities() -> List[Dict[str, Any]]:
 # ============================================================================
 
 
-def generate_forecast_for_opportunity(opp: Dict[str, Any], model: str = "gpt-5-thinking") -> ForecastData:
+def generate_forecast_for_opportunity(
+    opp: Dict[str, Any], model: str = "gpt-5-thinking", scores: Optional[Dict[str, Any]] = None
+) -> ForecastData:
     """
     Generate forecast for a single opportunity with intelligent scoring.
     Phase 5: Integrates multi-factor scoring engine.
+
+    Pass ``scores`` (with reasoning) when the opportunity was already scored in a batch.
     """
     opp_id = opp.get("id", "unknown")
     opp_name = opp.get("name", opp.get("title", "Unknown Opportunity"))
@@ -179,7 +183,8 @@ def generate_forecast_for_opportunity(opp: Dict[str, Any], model: str = "gpt-5-t
         confidence = 65
 
     # Phase 9: Calculate enhanced intelligent scores with reasoning
-    scores = scorer.calculate_composite_score(opp, include_reasoning=True)
+    if scores is None:
+        scores = scorer.calculate_composite_score(opp, include_reasoning=True)
     confidence_interval = scorer.calculate_confidence_interval(scores["win_prob"], current_amount, stage)
 
     # Build detailed reasoning
@@ -268,8 +273,9 @@ async def run_forecast(request: ForecastRequest, x_request_id: str = Header(defa
 
         # Generate forecasts
         new_forecasts = []
-        for opp in opportunities:
-            forecast = generate_forecast_for_opportunity(opp, request.model)
+        batch_scores = scorer.score_batch(opportunities, include_reasoning=True)
+        for opp, scores in zip(opportunities, batch_scores):
+            forecast = generate_forecast_for_opportunity(opp, request.model, scores=scores)
             forecasts[forecast.opportunity_id] = forecast
             new_forecasts.append(forecast)
 
@@ -26,8 +26,20 @@ class ContractVehicleStore(EntityStore[ContractVehicle]):
 
     def __init__(self, storage_path: str = "data/entities/contract_vehicles.json"):
         """Initialize Contract Vehicle store."""
+        # All vehicles by priority (highest first); rebuilt lazily after load/save
+        self._by_priority: Optional[List[ContractVehicle]] = None
         super().__init__(storage_path, "ContractVehicle")
 
+    def load(self) -> None:
+        """Load contract vehicles and reset the priority index."""
+        self._by_priority = None
+        super().load()
+
+    def save(self) -> None:
+        """Save contract vehicles and reset the priority index."""
+        self._by_priority = None
+        super().save()
+
     def _create_entity(self, data: dict) -> ContractVehicle:
         """Create Contract Vehicle entity from dictionary."""
         return ContractVehicle(**data)
@@ -56,6 +68,31 @@ class ContractVehicleStore(EntityStore[ContractVehicle]):
         """
         return [cv for cv in self.get_all(active_only=True) if category in cv.categories]
 
+    def get_by_priority(self, active_only: bool = False, min_priority: Optional[float] = None) -> List[ContractVehicle]:
+        """
+        Get contract vehicles ordered by priority score, highest first.
+
+        Ties keep insertion order.
+
+        Args:
+            active_only: If True, only return active contract vehicles
+            min_priority: Stop at the first vehicle scoring below this
+
+        Returns:
+            List of contract vehicles sorted by priority
+        """
+        if self._by_priority is None:
+            self._by_priority = sorted(self.entities.values(), key=lambda cv: cv.priority_score, reverse=True)
+
+        result = []
+        for cv in self._by_priority:
+            if min_priority is not None and cv.priority_score < min_priority:
+                break
+            if active_only and not cv.active:
+                continue
+            result.append(cv)
+        return result
+
     def get_priority_score(self, cv_name: str) -> float:
         """
         Get priority score for a contract vehicle.
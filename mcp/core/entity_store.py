@@ -11,7 +11,7 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Generic type for entity models
 T = TypeVar("T", bound=BaseModel)
 
+# Sentinel for filter fields an entity doesn't have (never equal to a filter value)
+_MISSING = object()
+
 
 class BaseEntity(BaseModel):
     """Base model for all entities with common fields."""
@@ -63,6 +66,8 @@ class EntityStore(Generic[T], ABC):
         self.storage_path = Path(storage_path)
         self.entity_type = entity_type
         self.entities: Dict[str, T] = {}
+        # Field value -> entities (insertion order), built on demand; reset on load/save
+        self._indexes: Dict[str, Dict[Any, List[T]]] = {}
         self.load()
 
     @abstractmethod
@@ -83,6 +88,7 @@ class EntityStore(Generic[T], ABC):
         Load entities from JSON file.
         Auto-creates file if missing.
         """
+        self._indexes = {}
         if not self.storage_path.exists():
             logger.info(f"Creating new {self.entity_type} store at {self.storage_path}")
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
@@ -102,6 +108,7 @@ class EntityStore(Generic[T], ABC):
 
     def save(self) -> None:
         """Save all entities to JSON file."""
+        self._indexes = {}
         entities_list = [e.model_dump(mode="json") for e in self.entities.values()]
         self._write_to_disk({"entities": entities_list})
         logger.debug(f"Saved {len(self.entities)} {self.entity_type} entities")
@@ -156,21 +163,41 @@ class EntityStore(Generic[T], ABC):
                 return entity
         return None
 
-    def get_all(self, active_only: bool = False) -> List[T]:
+    def get_all(self, active_only: bool = False, **filters) -> List[T]:
         """
-        Get all entities.
+        Get all entities, optionally filtered in a single pass.
 
         Args:
             active_only: If True, only return active entities
+            **filters: Field=value pairs to match; None values are ignored
 
         Returns:
-            List of all entities
+            List of matching entities
         """
-        entities = list(self.entities.values())
+        filters = {key: value for key, value in filters.items() if value is not None}
+        entities = self.search(**filters) if filters else list(self.entities.values())
         if active_only:
-            entities = [e for e in entities if e.active]
+            return [e for e in entities if e.active]
         return entities
 
+    def _index(self, field: str) -> Dict[Any, List[T]]:
+        """
+        Group entities by a field value, building the index on first use.
+
+        Args:
+            field: Entity field name
+
+        Returns:
+            Dictionary of field value to entities, in insertion order
+        """
+        index = self._indexes.get(field)
+        if index is None:
+            index = {}
+            for entity in self.entities.values():
+                index.setdefault(getattr(entity, field, _MISSING), []).append(entity)
+            self._indexes[field] = index
+        return index
+
     def add(self, entity: T) -> T:
         """
         Add new entity.
@@ -263,22 +290,25 @@ class EntityStore(Generic[T], ABC):
         """
         Search entities by filters.
 
+        The first filter is looked up through its field index, which is
+        rebuilt on load/save; every filter, including the first, is then
+        compared against the live entity values.
+
         Args:
             **filters: Field=value pairs to filter by
 
         Returns:
             List of matching entities
         """
-        results = []
-        for entity in self.entities.values():
-            match = True
-            for key, value in filters.items():
-                if not hasattr(entity, key) or getattr(entity, key) != value:
-                    match = False
-                    break
-            if match:
-                results.append(entity)
-        return results
+        if not filters:
+            return list(self.entities.values())
+
+        field, value = next(iter(filters.items()))
+        try:
+            candidates = self._index(field).get(value, [])
+        except TypeError:  # unhashable field values; scan instead
+            candidates = self.entities.values()
+        return [e for e in candidates if all(getattr(e, key, _MISSING) == v for key, v in filters.items())]
 
     def count(self, active_only: bool = False) -> int:
         """
@@ -6,13 +6,28 @@ adjacency list representation and basic analytics capabilities.
 
 import json
 import logging
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _intern(value: Any) -> Any:
+    """Intern str values; pass anything else (None, str subclasses) through unchanged."""
+    try:
+        return sys.intern(value)
+    except TypeError:
+        return value
+
+
 @dataclass
 class PartnerNode:
     """Represents a partner node in the graph."""
@@ -25,6 +40,12 @@ class PartnerNode:
     notes: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Low-cardinality fields: intern so repeated values share one object
+        self.tier = _intern(self.tier)
+        self.oem = _intern(self.oem)
+        self.program = _intern(self.program)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert node to dictionary representation."""
         return {
@@ -38,7 +59,7 @@ class PartnerNode:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PartnerRelationship:
     """Represents a relationship edge between partners or partner-OEM."""
 
@@ -48,6 +69,9 @@ class PartnerRelationship:
     weight: float = 1.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        self.relationship_type = _intern(self.relationship_type)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert relationship to dictionary representation."""
         return {
@@ -66,7 +90,15 @@ class PartnerGraph:
         """Initialize empty partner graph."""
         self.nodes: Dict[str, PartnerNode] = {}
         self.edges: List[PartnerRelationship] = []
-        self._adjacency_list: Dict[str, List[str]] = {}
+        # Neighbors kept as insertion-ordered dict keys: O(1) membership, stable order
+        self._adjacency_list: Dict[str, Dict[str, None]] = {}
+        # Inverted indexes maintained on insert (tier keys are lowercased)
+        self._by_oem: Dict[str, List[PartnerNode]] = {}
+        self._by_tier: Dict[str, List[PartnerNode]] = {}
+        # Analytics memo, invalidated lazily whenever the generation counter moves
+        self._gen = 0
+        self._cache_gen = 0
+        self._cache: Dict[Tuple[str, str], Any] = {}
         self.created_at = datetime.now(timezone.utc).isoformat()
 
     def add_node(self, node: PartnerNode) -> None:
@@ -75,9 +107,23 @@ class PartnerGraph:
         Args:
             node: PartnerNode to add
         """
+        previous = self.nodes.get(node.name)
+        if previous is not None:
+            self._unindex(previous)
         self.nodes[node.name] = node
-        if node.name not in self._adjacency_list:
-            self._adjacency_list[node.name] = []
+        self._by_oem.setdefault(node.oem, []).append(node)
+        self._by_tier.setdefault(node.tier.lower(), []).append(node)
+        self._gen += 1
+        self._adjacency_list.setdefault(node.name, {})
+
+    def _unindex(self, node: PartnerNode) -> None:
+        """Remove a replaced node from the inverted indexes."""
+        for index, key in ((self._by_oem, node.oem), (self._by_tier, node.tier.lower())):
+            bucket = index.get(key, [])
+            if node in bucket:
+                bucket.remove(node)
+            if not bucket:
+                index.pop(key, None)
 
     def add_edge(self, edge: PartnerRelationship) -> None:
         """Add a relationship edge to the graph.
@@ -86,20 +132,14 @@ class PartnerGraph:
             edge: PartnerRelationship to add
         """
         self.edges.append(edge)
+        self._gen += 1
 
-        # Update adjacency list (bidirectional for partner-partner relationships)
-        if edge.source not in self._adjacency_list:
-            self._adjacency_list[edge.source] = []
-        if edge.target not in self._adjacency_list:
-            self._adjacency_list[edge.target] = []
-
-        if edge.target not in self._adjacency_list[edge.source]:
-            self._adjacency_list[edge.source].append(edge.target)
+        # Update adjacency sets (bidirectional for partner-partner relationships)
+        self._adjacency_list.setdefault(edge.source, {})[edge.target] = None
+        target_neighbors = self._adjacency_list.setdefault(edge.target, {})
 
-        # Bidirectional for partner-partner relationships
         if edge.relationship_type == "partner_partner":
-            if edge.source not in self._adjacency_list[edge.target]:
-                self._adjacency_list[edge.target].append(edge.source)
+            target_neighbors[edge.source] = None
 
     def get_neighbors(self, node_name: str) -> List[str]:
         """Get all neighbors of a node.
@@ -110,7 +150,18 @@ class PartnerGraph:
         Returns:
             List of neighbor node names
         """
-        return self._adjacency_list.get(node_name, [])
+        return list(self._adjacency_list.get(node_name, ()))
+
+    def _analytics_cache(self) -> Dict[Tuple[str, str], Any]:
+        """Get the analytics memo, clearing it if the graph changed since it was filled."""
+        if self._cache_gen != self._gen:
+            self._cache.clear()
+            self._cache_gen = self._gen
+        return self._cache
+
+    def _neighbors(self, node_name: str) -> Dict[str, None]:
+        """Get the internal ordered neighbor set for a node (do not mutate)."""
+        return self._adjacency_list.get(node_name, {})
 
     def get_degree(self, node_name: str) -> int:
         """Get degree (number of connections) for a node.
@@ -121,7 +172,7 @@ class PartnerGraph:
         Returns:
             Number of connections
         """
-        return len(self.get_neighbors(node_name))
+        return len(self._neighbors(node_name))
 
     def get_degree_centrality(self, node_name: str) -> float:
         """Calculate degree centrality for a node.
@@ -137,9 +188,26 @@ class PartnerGraph:
         if len(self.nodes) <= 1:
             return 0.0
 
-        degree = self.get_degree(node_name)
-        max_possible = len(self.nodes) - 1
-        return degree / max_possible
+        all_centrality = self._analytics_cache().get(("degree_centrality", ""))
+        if all_centrality is not None and node_name in all_centrality:
+            return all_centrality[node_name]
+        return self.get_degree(node_name) / (len(self.nodes) - 1)
+
+    def all_degree_centrality(self) -> Dict[str, float]:
+        """Calculate degree centrality for every partner node at once.
+
+        Returns:
+            Dictionary mapping node name to degree centrality
+        """
+        cache = self._analytics_cache()
+        key = ("degree_centrality", "")
+        if key not in cache:
+            max_possible = len(self.nodes) - 1
+            if max_possible > 0:
+                cache[key] = {name: len(self._neighbors(name)) / max_possible for name in self.nodes}
+            else:
+                cache[key] = {name: 0.0 for name in self.nodes}
+        return dict(cache[key])
 
     def get_clustering_coefficient(self, node_name: str) -> float:
         """Calculate clustering coefficient for a node.
@@ -152,7 +220,15 @@ class PartnerGraph:
         Returns:
             Clustering coefficient (0.0 to 1.0)
         """
-        neighbors = self.get_neighbors(node_name)
+        cache = self._analytics_cache()
+        key = ("clustering", node_name)
+        if key not in cache:
+            cache[key] = self._compute_clustering_coefficient(node_name)
+        return cache[key]
+
+    def _compute_clustering_coefficient(self, node_name: str) -> float:
+        """Compute clustering coefficient for a node (uncached)."""
+        neighbors = list(self._neighbors(node_name))
         k = len(neighbors)
 
         if k < 2:
@@ -161,8 +237,9 @@ class PartnerGraph:
         # Count edges between neighbors
         edges_between_neighbors = 0
         for i, n1 in enumerate(neighbors):
+            n1_neighbors = self._neighbors(n1)
             for n2 in neighbors[i + 1 :]:
-                if n2 in self.get_neighbors(n1):
+                if n2 in n1_neighbors:
                     edges_between_neighbors += 1
 
         # Maximum possible edges between k neighbors
@@ -170,6 +247,30 @@ class PartnerGraph:
 
         return edges_between_neighbors / max_possible if max_possible > 0 else 0.0
 
+    def analytics(self) -> Dict[str, Dict[str, float]]:
+        """Compute per-node analytics for every partner in one pass.
+
+        Fills the same memo used by the single-node getters, so later
+        get_degree_centrality/get_clustering_coefficient calls are free.
+
+        Returns:
+            Dictionary mapping node name to degree, degree centrality,
+            and clustering coefficient
+        """
+        cache = self._analytics_cache()
+        key = ("analytics", "")
+        if key not in cache:
+            centrality = self.all_degree_centrality()
+            cache[key] = {
+                node_name: {
+                    "degree": self.get_degree(node_name),
+                    "degree_centrality": centrality[node_name],
+                    "clustering_coefficient": self.get_clustering_coefficient(node_name),
+                }
+                for node_name in self.nodes
+            }
+        return {name: dict(metrics) for name, metrics in cache[key].items()}
+
     def get_partners_by_oem(self, oem: str) -> List[PartnerNode]:
         """Get all partners for a specific OEM.
 
@@ -179,7 +280,7 @@ class PartnerGraph:
         Returns:
             List of partner nodes
         """
-        return [node for node in self.nodes.values() if node.oem == oem]
+        return list(self._by_oem.get(oem, ()))
 
     def get_partners_by_tier(self, tier: str) -> List[PartnerNode]:
         """Get all partners in a specific tier.
@@ -190,7 +291,7 @@ class PartnerGraph:
         Returns:
             List of partner nodes
         """
-        return [node for node in self.nodes.values() if node.tier.lower() == tier.lower()]
+        return list(self._by_tier.get(tier.lower(), ()))
 
     def get_oem_distribution(self) -> Dict[str, int]:
         """Get distribution of partners across OEMs.
@@ -198,10 +299,7 @@ class PartnerGraph:
         Returns:
             Dictionary mapping OEM to partner count
         """
-        distribution: Dict[str, int] = {}
-        for node in self.nodes.values():
-            distribution[node.oem] = distribution.get(node.oem, 0) + 1
-        return distribution
+        return {oem: len(nodes) for oem, nodes in self._by_oem.items()}
 
     def get_tier_distribution(self) -> Dict[str, int]:
         """Get distribution of partners across tiers.
@@ -209,33 +307,56 @@ class PartnerGraph:
         Returns:
             Dictionary mapping tier to partner count
         """
-        distribution: Dict[str, int] = {}
-        for node in self.nodes.values():
-            tier = node.tier.lower()
-            distribution[tier] = distribution.get(tier, 0) + 1
-        return distribution
+        return {tier: len(nodes) for tier, nodes in self._by_tier.items()}
 
     def get_connected_components(self) -> List[Set[str]]:
         """Find all connected components in the graph.
 
+        Uses iterative union-find over the edge list (edges treated as
+        undirected), so large graphs cannot hit the recursion limit.
+
         Returns:
             List of sets, each containing partner names in a component
         """
-        visited: Set[str] = set()
+        names = list(self._adjacency_list)
+        for node_name in self.nodes:
+            if node_name not in self._adjacency_list:
+                names.append(node_name)
+        idx = {name: i for i, name in enumerate(names)}
+        parent = list(range(len(names)))
+        rank = [0] * len(names)
+
+        def find(i: int) -> int:
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+            return root
+
+        for edge in self.edges:
+            a = find(idx[edge.source])
+            b = find(idx[edge.target])
+            if a == b:
+                continue
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+
+        groups: Dict[int, Set[str]] = defaultdict(set)
+        for i, name in enumerate(names):
+            groups[find(i)].add(name)
+
+        # Emit components in node insertion order; skip groups with no partner node
         components: List[Set[str]] = []
-
-        def dfs(node: str, component: Set[str]):
-            visited.add(node)
-            component.add(node)
-            for neighbor in self.get_neighbors(node):
-                if neighbor not in visited:
-                    dfs(neighbor, component)
-
+        seen: Set[int] = set()
         for node_name in self.nodes:
-            if node_name not in visited:
-                component: Set[str] = set()
-                dfs(node_name, component)
-                components.append(component)
+            root = find(idx[node_name])
+            if root not in seen:
+                seen.add(root)
+                components.append(groups[root])
 
         return components
 
@@ -245,20 +366,19 @@ class PartnerGraph:
         Returns:
             Dictionary mapping node name to list of adjacent nodes with metadata
         """
-        adj_list: Dict[str, List[Dict[str, Any]]] = {}
-
-        for node_name in self.nodes:
-            adj_list[node_name] = []
-
-            for edge in self.edges:
-                if edge.source == node_name:
-                    adj_list[node_name].append(
-                        {
-                            "target": edge.target,
-                            "type": edge.relationship_type,
-                            "weight": edge.weight,
-                        }
-                    )
+        adj_list: Dict[str, List[Dict[str, Any]]] = {node_name: [] for node_name in self.nodes}
+
+        # Single pass over edges; edges whose source is not a partner node are omitted
+        for edge in self.edges:
+            targets = adj_list.get(edge.source)
+            if targets is not None:
+                targets.append(
+                    {
+                        "target": edge.target,
+                        "type": edge.relationship_type,
+                        "weight": edge.weight,
+                    }
+                )
 
         return adj_list
 
@@ -291,6 +411,8 @@ class PartnerGraph:
         Returns:
             JSON string representation
         """
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(self.to_dict(), indent=indent)
 
 
@@ -351,7 +473,8 @@ def build_partner_graph(partner_records: List[Dict[str, Any]]) -> PartnerGraph:
                 )
                 graph.add_edge(edge)
 
-    # Build same-program edges
+    # Build same-program edges; index existing pairs instead of rescanning the edge list
+    linked: Set[Tuple[str, str]] = {(e.source, e.target) for e in graph.edges}
     program_partners: Dict[str, List[str]] = {}
     for record in partner_records:
         program = record["program"]
@@ -364,8 +487,8 @@ def build_partner_graph(partner_records: List[Dict[str, Any]]) -> PartnerGraph:
             for i, p1 in enumerate(partners):
                 for p2 in partners[i + 1 :]:
                     # Only add if not already connected
-                    existing = any(e.source == p1 and e.target == p2 or e.source == p2 and e.target == p1 for e in graph.edges)
-                    if not existing:
+                    if (p1, p2) not in linked and (p2, p1) not in linked:
+                        linked.add((p1, p2))
                         edge = PartnerRelationship(
                             source=p1,
                             target=p2,
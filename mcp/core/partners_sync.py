@@ -8,12 +8,104 @@ diffs against existing OEMStore, and updates records.
 import csv
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to read partner files concurrently
+_MAX_LOAD_WORKERS = 8
+
+# Store path -> ((mtime_ns, size), parsed records); shared so per-request
+# PartnerTierSync instances in the API handlers reuse one parse
+_STORE_CACHE: Dict[Path, Tuple[Tuple[int, int], List[Dict]]] = {}
+
+# Canonical capitalization keyed by lowercased input
+_TIER_MAP = {
+    "platinum": "Platinum",
+    "gold": "Gold",
+    "silver": "Silver",
+    "bronze": "Bronze",
+    "partner": "Partner",
+    "authorized": "Authorized",
+}
+
+_OEM_MAP = {
+    "cisco": "Cisco",
+    "nutanix": "Nutanix",
+    "dell": "Dell",
+    "hp": "HP",
+    "hpe": "HPE",
+    "lenovo": "Lenovo",
+    "vmware": "VMware",
+    "microsoft": "Microsoft",
+    "aws": "AWS",
+    "azure": "Azure",
+    "google": "Google",
+    "oracle": "Oracle",
+    "ibm": "IBM",
+    "redhat": "Red Hat",
+    "red hat": "Red Hat",
+}
+
+# CSV columns mapped to PartnerTierRecord kwargs, with the default used when a column is absent
+_CSV_FIELDS = (
+    ("name", ""),
+    ("tier", ""),
+    ("program", ""),
+    ("oem", ""),
+    ("poc", None),
+    ("notes", None),
+    ("updated_at", None),
+    ("created_at", None),
+)
+
+# Fields compared when diffing against the store (timestamps excluded)
+_DIFF_FIELDS = ("tier", "program", "oem", "poc", "notes")
+_diff_key = attrgetter(*_DIFF_FIELDS)
+
+
+# Export bucket for store records with a missing or null OEM
+_UNKNOWN_OEM = "Unknown"
+
+
+def _oem_key(partner: Dict) -> str:
+    """Grouping key for store records; missing or null OEMs group under Unknown"""
+    return partner.get("oem") or _UNKNOWN_OEM
+
+
+@lru_cache(maxsize=1024)
+def _normalize_tier(tier: str) -> str:
+    """Normalize tier to standard capitalization (few distinct values, so memoized)"""
+    tier_clean = tier.strip()
+    return _TIER_MAP.get(tier_clean.lower()) or tier_clean.title()
+
+
+@lru_cache(maxsize=1024)
+def _normalize_oem(oem: str) -> str:
+    """Normalize OEM name (few distinct values, so memoized)"""
+    oem_clean = oem.strip()
+    return _OEM_MAP.get(oem_clean.lower()) or oem_clean
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 
 class PartnerSyncError(Exception):
     """Base exception for partner sync operations"""
@@ -24,6 +116,8 @@ class PartnerSyncError(Exception):
 class PartnerTierRecord:
     """Normalized partner tier record"""
 
+    __slots__ = ("name", "tier", "program", "oem", "poc", "notes", "updated_at", "created_at")
+
     def __init__(
         self,
         name: str,
@@ -46,38 +140,11 @@ class PartnerTierRecord:
 
     def _normalize_tier(self, tier: str) -> str:
         """Normalize tier to standard capitalization"""
-        tier_clean = tier.strip().lower()
-        tier_map = {
-            "platinum": "Platinum",
-            "gold": "Gold",
-            "silver": "Silver",
-            "bronze": "Bronze",
-            "partner": "Partner",
-            "authorized": "Authorized",
-        }
-        return tier_map.get(tier_clean, tier.strip().title())
+        return _normalize_tier(tier)
 
     def _normalize_oem(self, oem: str) -> str:
         """Normalize OEM name"""
-        oem_clean = oem.strip().lower()
-        oem_map = {
-            "cisco": "Cisco",
-            "nutanix": "Nutanix",
-            "dell": "Dell",
-            "hp": "HP",
-            "hpe": "HPE",
-            "lenovo": "Lenovo",
-            "vmware": "VMware",
-            "microsoft": "Microsoft",
-            "aws": "AWS",
-            "azure": "Azure",
-            "google": "Google",
-            "oracle": "Oracle",
-            "ibm": "IBM",
-            "redhat": "Red Hat",
-            "red hat": "Red Hat",
-        }
-        return oem_map.get(oem_clean, oem.strip())
+        return _normalize_oem(oem)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -138,44 +205,59 @@ class PartnerTierSync:
             paths.extend(self.partners_dir.glob("partners_*.csv"))
             paths.extend(self.partners_dir.glob("partners_*.json"))
 
-        records = []
+        paths = list(paths)
+        records: List[PartnerTierRecord] = []
 
-        for path in paths:
-            try:
-                if path.suffix.lower() == ".csv":
-                    records.extend(self._load_csv(path))
-                elif path.suffix.lower() == ".json":
-                    records.extend(self._load_json(path))
-                else:
-                    logger.warning(f"Skipping unsupported file: {path}")
-            except Exception as e:
-                logger.error(f"Failed to load {path}: {e}")
-                raise PartnerSyncError(f"Failed to load {path}: {e}")
+        if len(paths) <= 1:
+            for path in paths:
+                records.extend(self._load_one(path))
+            return records
+
+        # Files are independent: read/parse them concurrently, merge in input order
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(paths))) as executor:
+            for batch in executor.map(self._load_one, paths):
+                records.extend(batch)
 
         return records
 
+    def _load_one(self, path: Path) -> List[PartnerTierRecord]:
+        """Load a single partner file, dispatching on its suffix"""
+        suffix = path.suffix.lower()
+        try:
+            if suffix == ".csv":
+                return self._load_csv(path)
+            if suffix == ".json":
+                return self._load_json(path)
+        except Exception as e:
+            logger.error(f"Failed to load {path}: {e}")
+            raise PartnerSyncError(f"Failed to load {path}: {e}")
+        logger.warning(f"Skipping unsupported file: {path}")
+        return []
+
     def _load_csv(self, path: Path) -> List[PartnerTierRecord]:
         """Load partner tier records from CSV file"""
         records = []
 
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return records
+
+            # Resolve column positions once instead of building a dict per row
+            columns = {column: i for i, column in enumerate(header)}
+            layout = [(field, columns.get(field), default) for field, default in _CSV_FIELDS]
 
             for row in reader:
+                if not row:
+                    continue
                 try:
-                    record = PartnerTierRecord(
-                        name=row.get("name", ""),
-                        tier=row.get("tier", ""),
-                        program=row.get("program", ""),
-                        oem=row.get("oem", ""),
-                        poc=row.get("poc"),
-                        notes=row.get("notes"),
-                        updated_at=row.get("updated_at"),
-                        created_at=row.get("created_at"),
-                    )
-                    records.append(record)
+                    kwargs = {field: (row[i] if i < len(row) else None) if i is not None else default for field, i, default in layout}
+                    record = PartnerTierRecord(**kwargs)
                 except Exception as e:
                     logger.error(f"Failed to parse CSV row from {path}: {e}")
+                    continue
+                records.append(record)
 
         return records
 
@@ -183,31 +265,30 @@ class PartnerTierSync:
         """Load partner tier records from JSON file"""
         records = []
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(path)
 
-            # Support both array and object with 'partners' key
-            if isinstance(data, dict) and "partners" in data:
-                data = data["partners"]
+        # Support both array and object with 'partners' key
+        if isinstance(data, dict) and "partners" in data:
+            data = data["partners"]
 
-            if not isinstance(data, list):
-                raise PartnerSyncError(f"JSON file {path} must contain an array or object with 'partners' key")
+        if not isinstance(data, list):
+            raise PartnerSyncError(f"JSON file {path} must contain an array or object with 'partners' key")
 
-            for item in data:
-                try:
-                    record = PartnerTierRecord(
-                        name=item.get("name", ""),
-                        tier=item.get("tier", ""),
-                        program=item.get("program", ""),
-                        oem=item.get("oem", ""),
-                        poc=item.get("poc"),
-                        notes=item.get("notes"),
-                        updated_at=item.get("updated_at"),
-                        created_at=item.get("created_at"),
-                    )
-                    records.append(record)
-                except Exception as e:
-                    logger.error(f"Failed to parse JSON item from {path}: {e}")
+        for item in data:
+            try:
+                record = PartnerTierRecord(
+                    name=item.get("name", ""),
+                    tier=item.get("tier", ""),
+                    program=item.get("program", ""),
+                    oem=item.get("oem", ""),
+                    poc=item.get("poc"),
+                    notes=item.get("notes"),
+                    updated_at=item.get("updated_at"),
+                    created_at=item.get("created_at"),
+                )
+                records.append(record)
+            except Exception as e:
+                logger.error(f"Failed to parse JSON item from {path}: {e}")
 
         return records
 
@@ -254,25 +335,21 @@ class PartnerTierSync:
         unchanged = []
 
         for record in records:
-            record_dict = record.to_dict()
+            existing_record = existing_map.get(record.name)
 
-            if record.name not in existing_map:
+            if existing_record is None:
                 # New record
-                added.append(record_dict)
+                added.append(record.to_dict())
+                continue
+
+            # Compare key fields as a single tuple; only materialize dicts for changed records
+            if _diff_key(record) != tuple(existing_record.get(field) for field in _DIFF_FIELDS):
+                record_dict = record.to_dict()
+                # Preserve created_at from existing
+                record_dict["created_at"] = existing_record.get("created_at", record_dict["created_at"])
+                updated.append(record_dict)
             else:
-                # Check if updated
-                existing_record = existing_map[record.name]
-
-                # Compare key fields (excluding timestamps)
-                fields_to_compare = ["tier", "program", "oem", "poc", "notes"]
-                has_changes = any(record_dict.get(field) != existing_record.get(field) for field in fields_to_compare)
-
-                if has_changes:
-                    # Preserve created_at from existing
-                    record_dict["created_at"] = existing_record.get("created_at", record_dict["created_at"])
-                    updated.append(record_dict)
-                else:
-                    unchanged.append(existing_record)
+                unchanged.append(existing_record)
 
         return {
             "added": added,
@@ -334,22 +411,16 @@ class PartnerTierSync:
         # Load current store
         partners = self._load_store()
 
-        # Group by OEM
-        oem_groups: Dict[str, List[Dict]] = {}
-        for partner in partners:
-            oem = partner["oem"]
-            if oem not in oem_groups:
-                oem_groups[oem] = []
-            oem_groups[oem].append(partner)
-
         # Create output directory
         oems_dir = self.vault_root / "30 Hubs" / "OEMs"
         oems_dir.mkdir(parents=True, exist_ok=True)
 
         files_written = []
 
-        # Write per-OEM files
-        for oem, oem_partners in oem_groups.items():
+        # Group by OEM (sorted, so each group streams straight into its file)
+        partners.sort(key=_oem_key)
+        for oem, group in groupby(partners, key=_oem_key):
+            oem_partners = list(group)
             filename = f"{oem}.md"
             filepath = oems_dir / filename
 
@@ -357,56 +428,64 @@ class PartnerTierSync:
             content = self._generate_oem_markdown(oem, oem_partners)
 
             # Write file
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
+            filepath.write_text(content, encoding="utf-8")
 
             files_written.append(str(filepath))
 
         return {
             "status": "success",
             "files_written": files_written,
-            "oems_count": len(oem_groups),
+            "oems_count": len(files_written),
         }
 
     def _generate_oem_markdown(self, oem: str, partners: List[Dict]) -> str:
         """Generate markdown content for an OEM"""
-        lines = [
-            f"# {oem}",
-            "",
-            "## Partner Tiers",
-            "",
-        ]
+        # One string per partner block instead of one list entry per line
+        blocks = [f"# {oem}\n\n## Partner Tiers\n"]
 
         for partner in sorted(partners, key=lambda p: p["name"]):
-            lines.append(f"### {partner['name']}")
-            lines.append(f"- **Tier**: {partner['tier']}")
-            lines.append(f"- **Program**: {partner['program']}")
-            if partner.get("poc"):
-                lines.append(f"- **POC**: {partner['poc']}")
-            if partner.get("notes"):
-                lines.append(f"- **Notes**: {partner['notes']}")
-            lines.append(f"- **Updated**: {partner.get('updated_at', 'N/A')}")
-            lines.append("")
-
-        return "\n".join(lines)
+            poc = f"- **POC**: {partner['poc']}\n" if partner.get("poc") else ""
+            notes = f"- **Notes**: {partner['notes']}\n" if partner.get("notes") else ""
+            blocks.append(
+                f"### {partner['name']}\n"
+                f"- **Tier**: {partner['tier']}\n"
+                f"- **Program**: {partner['program']}\n"
+                f"{poc}{notes}"
+                f"- **Updated**: {partner.get('updated_at', 'N/A')}\n"
+            )
+
+        return "\n".join(blocks)
 
     def _load_store(self) -> List[Dict]:
-        """Load existing OEMStore data"""
-        if not self.store_path.exists():
+        """Load existing OEMStore data, reusing the last parse while the file is unchanged
+
+        Each call returns fresh copies of the record dicts, so callers may
+        mutate them without touching the cached parse.
+        """
+        key = self.store_path.resolve()
+        try:
+            stat = self.store_path.stat()
+        except FileNotFoundError:
+            _STORE_CACHE.pop(key, None)
             return []
 
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _STORE_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return [dict(record) for record in cached[1]]
+
         try:
-            with open(self.store_path, "r") as f:
-                data = json.load(f)
-
-                # Handle both old OEMPartner format and new partner tier format
-                if isinstance(data, list):
-                    # New format or empty
-                    return data
-                else:
-                    # Unknown format
-                    logger.warning(f"Unexpected store format in {self.store_path}")
-                    return []
+            data = _read_json(self.store_path)
+
+            # Handle both old OEMPartner format and new partner tier format
+            if isinstance(data, list):
+                # New format or empty
+                _STORE_CACHE[key] = (signature, data)
+                return [dict(record) for record in data]
+            else:
+                # Unknown format
+                logger.warning(f"Unexpected store format in {self.store_path}")
+                return []
         except Exception as e:
             logger.error(f"Failed to load store from {self.store_path}: {e}")
             return []
@@ -415,11 +494,18 @@ class PartnerTierSync:
         """Write records to OEMStore atomically"""
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temp file first
+        if orjson is not None:
+            payload = orjson.dumps(records, default=str, option=orjson.OPT_INDENT_2) + b"\n"
+        else:
+            payload = (json.dumps(records, indent=2, default=str) + "\n").encode("utf-8")
+
+        # Write to temp file first, flushed to disk before the rename
         temp_path = self.store_path.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            json.dump(records, f, indent=2, default=str)
-            f.write("\n")
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
 
         # Atomic rename
-        temp_path.replace(self.store_path)
+        os.replace(temp_path, self.store_path)
+        _STORE_CACHE.pop(self.store_path.resolve(), None)
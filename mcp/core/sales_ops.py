@@ -4,18 +4,47 @@ Provides helper functions for enriching forecasts with partner context,
 calculating attributions, and preparing CRM exports.
 """
 
+import heapq
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 logger = logging.getLogger(__name__)
 
 
-def enrich_forecast_with_partners(forecast_data: Dict[str, Any], partner_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
+class PartnerIndex:
+    """Partner score lookups built once and shared across helper calls.
+
+    Every helper that takes ``partner_scores`` also accepts a PartnerIndex,
+    so callers running several helpers per request can build it once.
+    """
+
+    __slots__ = ("by_name", "by_oem")
+
+    def __init__(self, partner_scores: List[Dict[str, Any]]):
+        """Index partner scores by name (first entry wins) and by OEM."""
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_oem: Dict[Any, List[Dict[str, Any]]] = {}
+        for score in partner_scores:
+            self.by_name.setdefault(score["name"], score)
+            self.by_oem.setdefault(score.get("oem"), []).append(score)
+
+
+PartnerScores = Union[List[Dict[str, Any]], PartnerIndex]
+
+
+def _as_index(partner_scores: PartnerScores) -> PartnerIndex:
+    """Return partner_scores as a PartnerIndex, building one if needed."""
+    if isinstance(partner_scores, PartnerIndex):
+        return partner_scores
+    return PartnerIndex(partner_scores)
+
+
+def enrich_forecast_with_partners(forecast_data: Dict[str, Any], partner_scores: PartnerScores) -> Dict[str, Any]:
     """Enrich forecast data with partner intelligence context.
 
     Args:
         forecast_data: Forecast result dictionary
-        partner_scores: List of partner score dictionaries
+        partner_scores: List of partner score dictionaries or a PartnerIndex
 
     Returns:
         Enriched forecast with partner context
@@ -29,31 +58,33 @@ def enrich_forecast_with_partners(forecast_data: Dict[str, Any], partner_scores:
         if isinstance(partners, list):
             partner_names.update(partners)
 
+    # Nothing to look up: skip building the partner index
+    if not partner_names:
+        enriched["partner_context"] = {"engaged_partners": 0, "partners": [], "avg_partner_strength": 0.0}
+        return enriched
+
     # Find matching partner scores
+    score_by_name = _as_index(partner_scores).by_name
     partner_context = []
+    strength_sum = 0.0
     for name in partner_names:
-        for score in partner_scores:
-            if score["name"] == name:
-                partner_context.append(
-                    {
-                        "name": score["name"],
-                        "strength_score": score["strength_score"],
-                        "tier": score["tier"],
-                        "capabilities": score.get("capabilities", []),
-                    }
-                )
-                break
+        score = score_by_name.get(name)
+        if score is not None:
+            strength_sum += score["strength_score"]
+            partner_context.append(
+                {
+                    "name": score["name"],
+                    "strength_score": score["strength_score"],
+                    "tier": score["tier"],
+                    "capabilities": score.get("capabilities", []),
+                }
+            )
 
     # Add partner context to enriched data
     enriched["partner_context"] = {
         "engaged_partners": len(partner_context),
         "partners": partner_context,
-        "avg_partner_strength": round(
-            sum(p["strength_score"] for p in partner_context) / len(partner_context),
-            2,
-        )
-        if partner_context
-        else 0.0,
+        "avg_partner_strength": round(strength_sum / len(partner_context), 2) if partner_context else 0.0,
     }
 
     return enriched
@@ -115,15 +146,13 @@ def calculate_partner_attribution(opportunity: Dict[str, Any], partners: List[Di
     }
 
 
-def summarize_account_context(
-    account_name: str, opportunities: List[Dict[str, Any]], partner_scores: List[Dict[str, Any]]
-) -> Dict[str, Any]:
+def summarize_account_context(account_name: str, opportunities: List[Dict[str, Any]], partner_scores: PartnerScores) -> Dict[str, Any]:
     """Summarize account context with partner intelligence.
 
     Args:
         account_name: Account/customer name
         opportunities: List of opportunities for this account
-        partner_scores: List of partner score dictionaries
+        partner_scores: List of partner score dictionaries or a PartnerIndex
 
     Returns:
         Account summary with partner context
@@ -148,22 +177,22 @@ def summarize_account_context(
             partner_names.update(partners)
 
     # Get partner strength scores
-    partner_strengths = []
+    score_by_name = _as_index(partner_scores).by_name
+    strength_sum = 0.0
     engaged_partners = []
     for name in partner_names:
-        for score in partner_scores:
-            if score["name"] == name:
-                partner_strengths.append(score["strength_score"])
-                engaged_partners.append(
-                    {
-                        "name": score["name"],
-                        "tier": score["tier"],
-                        "strength_score": score["strength_score"],
-                    }
-                )
-                break
-
-    avg_strength = round(sum(partner_strengths) / len(partner_strengths), 2) if partner_strengths else 0.0
+        score = score_by_name.get(name)
+        if score is not None:
+            strength_sum += score["strength_score"]
+            engaged_partners.append(
+                {
+                    "name": score["name"],
+                    "tier": score["tier"],
+                    "strength_score": score["strength_score"],
+                }
+            )
+
+    avg_strength = round(strength_sum / len(engaged_partners), 2) if engaged_partners else 0.0
 
     return {
         "account_name": account_name,
@@ -171,7 +200,7 @@ def summarize_account_context(
         "opportunity_count": len(opportunities),
         "engaged_partners": engaged_partners,
         "partner_strength_avg": avg_strength,
-        "top_opportunities": sorted(opportunities, key=lambda x: x.get("amount", 0), reverse=True)[:5],
+        "top_opportunities": heapq.nlargest(5, opportunities, key=lambda x: x.get("amount", 0)),
     }
 
 
@@ -186,34 +215,37 @@ def prepare_crm_export_payload(opportunities: List[Dict[str, Any]], attribution_
         CRM export payload
     """
     # Build attribution lookup
-    attribution_map = {}
-    for attr in attribution_data:
-        opp_id = attr.get("opportunity_id")
-        if opp_id:
-            attribution_map[opp_id] = attr
+    attribution_map = {opp_id: attr for attr in attribution_data if (opp_id := attr.get("opportunity_id"))}
 
-    # Prepare opportunities with attribution
+    # Prepare opportunities with attribution, totalling the summary in the same pass
     export_opportunities = []
+    total_pipeline = 0
+    with_attribution = 0
     for opp in opportunities:
-        opp_id = opp.get("id", opp.get("name"))
+        opp_id = opp["id"] if "id" in opp else opp.get("name")
         attribution = attribution_map.get(opp_id, {})
+        amount = opp.get("amount", 0)
+        total_pipeline += amount
+        if attribution:
+            with_attribution += 1
 
-        export_opp = opp.copy()
-        export_opp["attribution"] = attribution
-
-        # Add CRM-specific fields
-        export_opp["crm_amount"] = opp.get("amount", 0)
-        export_opp["crm_stage"] = opp.get("stage", "Unknown")
-        export_opp["crm_close_date"] = opp.get("close_date")
-
-        export_opportunities.append(export_opp)
+        # Copy with attribution and CRM-specific fields
+        export_opportunities.append(
+            {
+                **opp,
+                "attribution": attribution,
+                "crm_amount": amount,
+                "crm_stage": opp.get("stage", "Unknown"),
+                "crm_close_date": opp.get("close_date"),
+            }
+        )
 
     return {
         "opportunities": export_opportunities,
         "summary": {
             "total_opportunities": len(export_opportunities),
-            "total_pipeline": round(sum(o.get("amount", 0) for o in opportunities), 2),
-            "with_attribution": sum(1 for o in export_opportunities if o.get("attribution")),
+            "total_pipeline": round(total_pipeline, 2),
+            "with_attribution": with_attribution,
         },
     }
 
@@ -234,26 +266,24 @@ def inject_partner_context_to_reasoning(reasoning: str, partner_context: Dict[st
     partners = partner_context["partners"]
     avg_strength = partner_context.get("avg_partner_strength", 0)
 
-    partner_summary = f"\n\nPartner Context: {len(partners)} engaged partners "
-    partner_summary += f"(avg strength: {avg_strength:.1f}/100). "
+    # List top partners (partners is non-empty here, so there is always at least one)
+    top_partners = heapq.nlargest(3, partners, key=lambda x: x["strength_score"])
+    key_partners = ", ".join(f"{p['name']} ({p['tier']})" for p in top_partners)
 
-    # List top partners
-    top_partners = sorted(partners, key=lambda x: x["strength_score"], reverse=True)[:3]
-    if top_partners:
-        partner_names = [f"{p['name']} ({p['tier']})" for p in top_partners]
-        partner_summary += f"Key partners: {', '.join(partner_names)}."
+    return (
+        f"{reasoning}\n\nPartner Context: {len(partners)} engaged partners "
+        f"(avg strength: {avg_strength:.1f}/100). Key partners: {key_partners}."
+    )
 
-    return reasoning + partner_summary
 
-
-def calculate_partner_coverage_score(opportunity: Dict[str, Any], partner_scores: List[Dict[str, Any]]) -> float:
+def calculate_partner_coverage_score(opportunity: Dict[str, Any], partner_scores: PartnerScores) -> float:
     """Calculate a coverage score based on partner engagement.
 
     Higher score indicates better partner coverage for the opportunity.
 
     Args:
         opportunity: Opportunity dictionary
-        partner_scores: List of partner score dictionaries
+        partner_scores: List of partner score dictionaries or a PartnerIndex
 
     Returns:
         Coverage score (0-100)
@@ -263,12 +293,8 @@ def calculate_partner_coverage_score(opportunity: Dict[str, Any], partner_scores
         return 0.0
 
     # Find partner scores
-    engaged_scores = []
-    for name in partner_names:
-        for score in partner_scores:
-            if score["name"] == name:
-                engaged_scores.append(score["strength_score"])
-                break
+    score_by_name = _as_index(partner_scores).by_name
+    engaged_scores = [score_by_name[name]["strength_score"] for name in partner_names if name in score_by_name]
 
     if not engaged_scores:
         return 0.0
@@ -280,12 +306,12 @@ def calculate_partner_coverage_score(opportunity: Dict[str, Any], partner_scores
     return min(100.0, avg_strength + coverage_bonus)
 
 
-def get_partner_recommendations(opportunity: Dict[str, Any], partner_scores: List[Dict[str, Any]], limit: int = 3) -> List[Dict[str, Any]]:
+def get_partner_recommendations(opportunity: Dict[str, Any], partner_scores: PartnerScores, limit: int = 3) -> List[Dict[str, Any]]:
     """Recommend partners for an opportunity based on OEM and capabilities.
 
     Args:
         opportunity: Opportunity dictionary
-        partner_scores: List of partner score dictionaries
+        partner_scores: List of partner score dictionaries or a PartnerIndex
         limit: Number of recommendations to return
 
     Returns:
@@ -295,8 +321,8 @@ def get_partner_recommendations(opportunity: Dict[str, Any], partner_scores: Lis
     if not oem:
         return []
 
-    # Filter partners by OEM
-    matching_partners = [p for p in partner_scores if p.get("oem") == oem]
+    # Partners for this OEM (copied so the index bucket is not reordered)
+    matching_partners = list(_as_index(partner_scores).by_oem.get(oem, ()))
 
     # Sort by strength score
     matching_partners.sort(key=lambda x: x["strength_score"], reverse=True)
@@ -16,8 +16,14 @@ Sprint 14: v2.1 Audited Bonuses & Guardrails
 - Minimal feature store stub for future persistence
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import json
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from mcp.core.config import scoring_config
 
@@ -54,13 +60,50 @@ MAX_SCORE = 100.0
 MIN_WIN_PROB = 0.0
 MAX_WIN_PROB = 1.0
 
+# Upper bound on memoized fuzzy-match results per config table
+_MATCH_MEMO_LIMIT = 4096
+
+# Deal size bands: amounts below _AMOUNT_THRESHOLDS[i] score _AMOUNT_SCORES[i]
+_AMOUNT_THRESHOLDS = (10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000, 10_000_000)
+_AMOUNT_SCORES = (20.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0, 95.0, 100.0)
+
+# Composite score weights (0-100 factor scores -> 0-100 raw score)
+_COMPOSITE_WEIGHTS = {
+    "oem_alignment": 0.25,
+    "partner_fit": 0.15,
+    "vehicle": 0.20,
+    "govly_relevance": 0.10,
+    "amount": 0.30,
+}
+_W_OEM, _W_PARTNER, _W_VEHICLE, _W_GOVLY, _W_AMOUNT = _COMPOSITE_WEIGHTS.values()
+
+# Days-until-close bands: fewer than _DECAY_DAY_THRESHOLDS[i] days decays by _DECAY_FACTORS[i]
+_DECAY_DAY_THRESHOLDS = (0, 30, 90, 180, 365)
+_DECAY_FACTORS = (0.5, 1.0, 0.95, 0.85, 0.75, 0.6)
+
+# Tag keywords that mark an opportunity as government-relevant
+_GOV_KEYWORDS = ("federal", "government", "agency", "dod", "civilian", "govly")
+
+# Customer org keyword -> org bonus tier, checked in order against the uppercased org name
+_ORG_KEYWORDS = (
+    ("DOD", "DOD"),
+    ("DEFENSE", "DOD"),
+    ("CIVIL", "Civilian"),
+    ("FEDERAL AGENCY A", "Civilian"),
+)
+
+# contracts_recommended count bucket -> (cv bonus key, fallback bonus)
+_CV_BONUS_SINGLE = ("single", 5.0)
+_CV_BONUS_MULTIPLE = ("multiple", 7.0)
+
 # ============================================================================
 # Feature Store (In-Memory Stub for Sprint 14)
 # ============================================================================
 
-# In-memory feature store: {opportunity_id: features_dict}
-# Production: persist to data/feature_store.jsonl
-_feature_store: Dict[str, Dict[str, Any]] = {}
+# In-memory feature store: {opportunity_id: (scored_at_ns, features_dict)}
+# Records are materialized (scored_at string, merged dict) only on read or flush.
+# Production: persist to data/feature_store.jsonl via flush_feature_store()
+_feature_store: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
 FEATURE_SCHEMA = {
     "opportunity_id": str,
@@ -73,17 +116,37 @@ FEATURE_SCHEMA = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _parse_close_date(close_date: str) -> Optional[datetime]:
+    """Parse an ISO close date once per distinct string; None if invalid."""
+    try:
+        return datetime.fromisoformat(close_date.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 def save_features(opportunity_id: str, features: Dict[str, Any]) -> None:
     """
     Save features to in-memory feature store (stub).
 
+    The features dict is stored as-is (not copied); callers should not
+    mutate it afterwards.
+
     Args:
         opportunity_id: Unique opportunity identifier
         features: Feature dictionary to store
     """
-    _feature_store[opportunity_id] = {
+    _feature_store[opportunity_id] = (time.time_ns(), features)
+
+
+def _materialize_features(opportunity_id: str, scored_at_ns: int, features: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the public feature record for a stored entry."""
+    seconds, nanos = divmod(scored_at_ns, 1_000_000_000)
+    scored_at = datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None, microsecond=nanos // 1000).isoformat() + "Z"
+    return {
         "opportunity_id": opportunity_id,
-        "scored_at": datetime.utcnow().isoformat() + "Z",
+        "scored_at": scored_at,
+        "scored_at_ns": scored_at_ns,
         **features,
     }
 
@@ -98,7 +161,146 @@ def get_features(opportunity_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Feature dictionary or None if not found
     """
-    return _feature_store.get(opportunity_id)
+    entry = _feature_store.get(opportunity_id)
+    if entry is None:
+        return None
+    return _materialize_features(opportunity_id, *entry)
+
+
+def flush_feature_store(path: str = "data/feature_store.jsonl") -> int:
+    """
+    Write all stored features to a JSONL file, one record per line.
+
+    Args:
+        path: Destination file (overwritten)
+
+    Returns:
+        Number of records written
+    """
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps(_materialize_features(opp_id, *entry), default=str) for opp_id, entry in _feature_store.items()]
+    file_path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    return len(lines)
+
+
+@lru_cache(maxsize=4096)
+def _gov_keyword_hits(tag: str) -> int:
+    """Number of government keywords contained in a tag (case-insensitive)."""
+    tag_lower = tag.lower()
+    return sum(1 for keyword in _GOV_KEYWORDS if keyword in tag_lower)
+
+
+def _first_match(pairs: List[Tuple[str, float]], text_lower: str) -> Optional[float]:
+    """Value of the first lowercased key contained in, or containing, text_lower."""
+    for key, value in pairs:
+        if key in text_lower or text_lower in key:
+            return value
+    return None
+
+
+@dataclass(slots=True)
+class ScoreResult:
+    """
+    Unrounded composite score for one opportunity.
+
+    Batch callers that only need a few numbers can read these fields directly;
+    to_dict() produces the rounded dictionary returned by calculate_composite_score.
+    """
+
+    score_raw: float
+    score_scaled: float
+    win_prob: float
+    oem_alignment_score: float
+    partner_fit_score: float
+    contract_vehicle_score: float
+    govly_relevance_score: float
+    amount_score: float
+    stage_probability: float  # 0-100
+    time_decay_factor: float
+    region_bonus: float
+    customer_org_bonus: float
+    cv_recommendation_bonus: float
+    scored_at: str
+    score_reasoning: Optional[List[str]] = None
+
+    def to_dict(self, precision: int = 2) -> Dict[str, Any]:
+        """Round scores and build the score dictionary."""
+        result = {
+            "score_raw": round(self.score_raw, precision),
+            "score_scaled": round(self.score_scaled, precision),  # Enhanced with bonuses
+            "win_prob": round(self.win_prob, precision),
+            "oem_alignment_score": round(self.oem_alignment_score, precision),
+            "partner_fit_score": round(self.partner_fit_score, precision),
+            "contract_vehicle_score": round(self.contract_vehicle_score, precision),
+            "govly_relevance_score": round(self.govly_relevance_score, precision),
+            "amount_score": round(self.amount_score, precision),
+            "stage_probability": round(self.stage_probability, precision),
+            "time_decay_factor": round(self.time_decay_factor, precision),
+            # Phase 9: Enhanced factors
+            "region_bonus": round(self.region_bonus, precision),
+            "customer_org_bonus": round(self.customer_org_bonus, precision),
+            "cv_recommendation_bonus": round(self.cv_recommendation_bonus, precision),
+            "total_bonuses_applied": round(self.region_bonus + self.customer_org_bonus + self.cv_recommendation_bonus, precision),
+            "weights_used": dict(_COMPOSITE_WEIGHTS),
+            "scoring_model": "multi_factor_v2.1_audited",  # Sprint 14: v2.1
+            "scored_at": self.scored_at,
+        }
+
+        if self.score_reasoning is not None:
+            result["score_reasoning"] = self.score_reasoning
+
+        return result
+
+
+def _composite_math(
+    oem_score: float,
+    partner_score: float,
+    vehicle_score: float,
+    govly_score: float,
+    amount_score: float,
+    stage_prob: float,
+    time_factor: float,
+    region_bonus: float,
+    org_bonus: float,
+    cv_bonus: float,
+    max_total_bonus: float,
+    max_score: float,
+    min_win_prob: float,
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Numeric core of the composite score: weighted sum, bonus guardrails and win probability.
+
+    Returns:
+        (raw_score, enhanced_score, win_prob_scaled, region_bonus, org_bonus, cv_bonus),
+        with bonuses scaled down if they exceeded max_total_bonus
+    """
+    # Calculate weighted composite score (0-100)
+    raw_score = (
+        oem_score * _W_OEM + partner_score * _W_PARTNER + vehicle_score * _W_VEHICLE + govly_score * _W_GOVLY + amount_score * _W_AMOUNT
+    )
+
+    # Sprint 14 v2.1: Apply guardrails (from config)
+    # Cap total bonuses to prevent score inflation
+    total_bonuses = region_bonus + org_bonus + cv_bonus
+
+    # If bonuses exceeded cap, scale them proportionally
+    if total_bonuses > max_total_bonus:
+        scale_factor = max_total_bonus / total_bonuses
+        region_bonus *= scale_factor
+        org_bonus *= scale_factor
+        cv_bonus *= scale_factor
+
+    # Apply bonuses and cap final score
+    enhanced_score = min(raw_score + region_bonus + org_bonus + cv_bonus, max_score)
+
+    # Apply stage probability and time decay to get final win probability
+    win_probability = enhanced_score * stage_prob * time_factor / 100.0
+
+    # Scale win probability to 0-100 and apply bounds
+    win_prob_scaled = min(max(win_probability * 100, min_win_prob * 100), max_score)
+
+    return raw_score, enhanced_score, win_prob_scaled, region_bonus, org_bonus, cv_bonus
 
 
 class OpportunityScorer:
@@ -109,6 +311,10 @@ class OpportunityScorer:
     and business value alignment.
 
     Now uses centralized configuration from scoring_weights.json.
+
+    Match memos and lowered config tables live on the instance, so request
+    handlers should share the module-level ``scorer`` (``OpportunityScorer.instance()``)
+    rather than constructing a new scorer per request.
     """
 
     def __init__(self):
@@ -116,6 +322,15 @@ class OpportunityScorer:
         self.historical_win_rates = {}  # Will be populated from historical data
         # Load configuration from singleton
         self._config = scoring_config
+        # Per config table (keyed by identity): lowercased (key, value) pairs and a match memo
+        self._lowered_tables: Dict[int, Tuple[Dict[str, float], List[Tuple[str, float]], Dict[str, Optional[float]]]] = {}
+        # Stage multipliers table -> {lowercased stage: multiplier}, seeded with each canonical stage name
+        self._stage_lookup: Tuple[Optional[Dict[str, float]], Dict[str, float]] = (None, {})
+
+    @classmethod
+    def instance(cls) -> "OpportunityScorer":
+        """Get the shared module-level scorer."""
+        return scorer
 
     @property
     def OEM_ALIGNMENT_SCORES(self) -> Dict[str, float]:
@@ -132,6 +347,38 @@ class OpportunityScorer:
         """Get stage multipliers from config."""
         return self._config.stage_multipliers
 
+    def _table_entry(self, table: Dict[str, float]) -> Tuple[Dict[str, float], List[Tuple[str, float]], Dict[str, Optional[float]]]:
+        """Get the cached lowercased pairs and match memo for a config table, rebuilt after a config reload."""
+        cached = self._lowered_tables.get(id(table))
+        if cached is None or cached[0] is not table:
+            pairs = [(key.lower(), value) for key, value in table.items()]
+            # Seed the memo with the table's own keys, the most common inputs
+            memo = {key: _first_match(pairs, key) for key, _ in pairs}
+            cached = (table, pairs, memo)
+            self._lowered_tables[id(table)] = cached
+        return cached
+
+    def _match_table(self, table: Dict[str, float], text: str) -> Optional[float]:
+        """
+        Fuzzy-match text against a config table (first key contained in, or containing, the text).
+
+        Results are memoized per lowercased text since the same OEM/vehicle names recur across
+        a pipeline; the memo is dropped wholesale if it grows past _MATCH_MEMO_LIMIT entries.
+        """
+        return self._match_table_lower(table, text.lower())
+
+    def _match_table_lower(self, table: Dict[str, float], text_lower: str) -> Optional[float]:
+        """_match_table for text that is already lowercased."""
+        _, pairs, memo = self._table_entry(table)
+        if text_lower in memo:
+            return memo[text_lower]
+
+        matched = _first_match(pairs, text_lower)
+        if len(memo) >= _MATCH_MEMO_LIMIT:
+            memo.clear()
+        memo[text_lower] = matched
+        return matched
+
     def calculate_oem_alignment_score(self, oems: List[str]) -> float:
         """
         Calculate OEM alignment score based on strategic partnerships.
@@ -142,22 +389,29 @@ class OpportunityScorer:
         Returns:
             Score from 0-100
         """
+        return self._normalize_oems(oems)[1]
+
+    def _normalize_oems(self, oems: List[str]) -> Tuple[List[str], float]:
+        """
+        Lowercase OEM names once and compute their alignment score.
+
+        Returns:
+            (lowercased OEM names, OEM alignment score), shared by the OEM alignment
+            and partner fit calculations
+        """
+        table = self.OEM_ALIGNMENT_SCORES
         if not oems:
-            return self.OEM_ALIGNMENT_SCORES["Default"]
+            return [], table["Default"]
 
+        oems_lower = [oem.lower() for oem in oems]
         scores = []
-        for oem in oems:
+        for oem_lower in oems_lower:
             # Fuzzy matching - check if any known OEM is in the string
-            matched_score = None
-            for known_oem, score in self.OEM_ALIGNMENT_SCORES.items():
-                if known_oem.lower() in oem.lower() or oem.lower() in known_oem.lower():
-                    matched_score = score
-                    break
+            matched_score = self._match_table_lower(table, oem_lower)
+            scores.append(matched_score if matched_score else table["Default"])
 
-            scores.append(matched_score if matched_score else self.OEM_ALIGNMENT_SCORES["Default"])
-
-        # Return highest OEM score (best alignment)
-        return max(scores)
+        # Highest OEM score (best alignment)
+        return oems_lower, max(scores)
 
     def calculate_contract_vehicle_score(self, vehicle: str) -> float:
         """
@@ -173,9 +427,9 @@ class OpportunityScorer:
             return self.CONTRACT_VEHICLE_SCORES["Default"]
 
         # Check for exact or partial matches
-        for known_vehicle, score in self.CONTRACT_VEHICLE_SCORES.items():
-            if known_vehicle.lower() in vehicle.lower() or vehicle.lower() in known_vehicle.lower():
-                return score
+        score = self._match_table(self.CONTRACT_VEHICLE_SCORES, vehicle)
+        if score is not None:
+            return score
 
         return self.CONTRACT_VEHICLE_SCORES["Default"]
 
@@ -190,6 +444,10 @@ class OpportunityScorer:
         Returns:
             Score from 0-100
         """
+        return self._partner_fit_score_lower(partners, [oem.lower() for oem in oems] if partners else [])
+
+    def _partner_fit_score_lower(self, partners: List[str], oems_lower: List[str]) -> float:
+        """calculate_partner_fit_score for OEM names that are already lowercased."""
         if not partners:
             return 50.0  # Neutral score if no partners
 
@@ -200,12 +458,15 @@ class OpportunityScorer:
         if len(partners) > 1:
             score += min(len(partners) * 5, 20)  # Max +20 for multiple partners
 
-        # Bonus if partners align with OEMs (assumes named partnerships)
+        # Bonus if partners align with OEMs (assumes named partnerships);
+        # two aligned pairs already reach the cap, so stop counting there
         alignment_bonus = 0
-        for partner in partners:
-            for oem in oems:
-                if oem.lower() in partner.lower() or partner.lower() in oem.lower():
-                    alignment_bonus += 10
+        if oems_lower:
+            for partner in partners:
+                partner_lower = partner.lower()
+                alignment_bonus += 10 * sum(1 for oem_lower in oems_lower if oem_lower in partner_lower or partner_lower in oem_lower)
+                if alignment_bonus >= 20:
+                    break
 
         score += min(alignment_bonus, 20)  # Max +20 for alignment
 
@@ -228,10 +489,9 @@ class OpportunityScorer:
         if source and "govly" in source.lower():
             score = 85.0
 
-        # Check tags for government/federal indicators
-        gov_keywords = ["federal", "government", "agency", "dod", "civilian", "govly"]
+        # Check tags for government/federal indicators (each keyword in each tag counts)
         if tags:
-            matching_tags = sum(1 for tag in tags for keyword in gov_keywords if keyword in tag.lower())
+            matching_tags = sum(map(_gov_keyword_hits, tags))
             score += min(matching_tags * 10, 30)  # Max +30 for gov tags
 
         return min(score, 100.0)
@@ -251,24 +511,7 @@ class OpportunityScorer:
 
         # Logarithmic scale for deal size
         # $10K = 40, $100K = 60, $1M = 80, $10M = 95, $100M = 100
-        if amount < 10000:
-            return 20.0
-        elif amount < 50000:
-            return 40.0
-        elif amount < 100000:
-            return 50.0
-        elif amount < 250000:
-            return 60.0
-        elif amount < 500000:
-            return 70.0
-        elif amount < 1000000:
-            return 80.0
-        elif amount < 5000000:
-            return 90.0
-        elif amount < 10000000:
-            return 95.0
-        else:
-            return 100.0
+        return _AMOUNT_SCORES[bisect_right(_AMOUNT_THRESHOLDS, amount)]
 
     def calculate_stage_probability(self, stage: str) -> float:
         """
@@ -280,11 +523,30 @@ class OpportunityScorer:
         Returns:
             Probability from 0.0 to 1.0
         """
-        for known_stage, multiplier in self.STAGE_MULTIPLIERS.items():
-            if known_stage.lower() in stage.lower():
+        table = self.STAGE_MULTIPLIERS
+        stage_table, lookup = self._stage_lookup
+        if stage_table is not table:
+            lookup = {}
+            self._stage_lookup = (table, lookup)
+            # Seed with canonical names so the common case is a single dict hit
+            for known_stage, _ in self._table_entry(table)[1]:
+                lookup[known_stage] = self._scan_stage(table, known_stage)
+
+        stage_lower = stage.lower()
+        multiplier = lookup.get(stage_lower)
+        if multiplier is None:
+            multiplier = self._scan_stage(table, stage_lower)
+            if len(lookup) < _MATCH_MEMO_LIMIT:
+                lookup[stage_lower] = multiplier
+        return multiplier
+
+    def _scan_stage(self, table: Dict[str, float], stage_lower: str) -> float:
+        """First stage multiplier whose name is contained in the stage text, else Default."""
+        for known_stage, multiplier in self._table_entry(table)[1]:
+            if known_stage in stage_lower:
                 return multiplier
 
-        return self.STAGE_MULTIPLIERS["Default"]
+        return table["Default"]
 
     def calculate_time_decay_factor(self, close_date: str) -> float:
         """
@@ -296,27 +558,31 @@ class OpportunityScorer:
         Returns:
             Factor from 0.5 to 1.0
         """
-        try:
-            close_dt = datetime.fromisoformat(close_date.replace("Z", "+00:00"))
-            now = datetime.now(close_dt.tzinfo)
-            days_until_close = (close_dt - now).days
-
-            if days_until_close < 0:
-                return 0.5  # Past due - lower urgency
-            elif days_until_close < 30:
-                return 1.0  # Urgent - closing soon
-            elif days_until_close < 90:
-                return 0.95
-            elif days_until_close < 180:
-                return 0.85
-            elif days_until_close < 365:
-                return 0.75
-            else:
-                return 0.6  # Far future - lower urgency
-        except (ValueError, AttributeError):
+        close_dt = _parse_close_date(close_date) if isinstance(close_date, str) else None
+        if close_dt is None:
             return 0.75  # Default if date is invalid
 
-    def calculate_composite_score(self, opportunity: Dict[str, Any], include_reasoning: bool = False) -> Dict[str, Any]:
+        now = datetime.now(close_dt.tzinfo)
+        days_until_close = (close_dt - now).days
+
+        # Past due = 0.5, under 30 days = 1.0 (urgent), tapering to 0.6 beyond a year
+        return _DECAY_FACTORS[bisect_right(_DECAY_DAY_THRESHOLDS, days_until_close)]
+
+    def _batch_params(self) -> Dict[str, Any]:
+        """Resolve bonus tables and guardrails from config once per scoring call or batch."""
+        guardrails = self._config.guardrails
+        return {
+            "region_bonuses": self._config.region_bonuses,
+            "org_bonuses": self._config.customer_org_bonuses,
+            "cv_bonuses": self._config.cv_recommendation_bonuses,
+            "max_total_bonus": guardrails.get("max_total_bonus", 15.0),
+            "max_score": guardrails.get("max_score", 100.0),
+            "min_win_prob": guardrails.get("min_win_prob", 0.0),
+        }
+
+    def calculate_composite_score(
+        self, opportunity: Dict[str, Any], include_reasoning: bool = False, scored_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Calculate comprehensive multi-factor score for an opportunity.
 
@@ -325,10 +591,42 @@ class OpportunityScorer:
         Args:
             opportunity: Opportunity data dictionary
             include_reasoning: If True, include detailed score reasoning
+            scored_at: Optional scored_at timestamp to reuse (defaults to the current UTC time)
 
         Returns:
             Dictionary containing all scores and final win probability
         """
+        if scored_at is None:
+            scored_at = datetime.utcnow().isoformat() + "Z"
+        return self._score_opportunity(opportunity, include_reasoning, self._batch_params(), scored_at).to_dict()
+
+    def score_batch(
+        self, opportunities: List[Dict[str, Any]], include_reasoning: bool = False, as_results: bool = False
+    ) -> Union[List[Dict[str, Any]], List[ScoreResult]]:
+        """
+        Score many opportunities, sharing config lookups and the scored_at timestamp.
+
+        Args:
+            opportunities: Opportunity data dictionaries
+            include_reasoning: If True, include detailed score reasoning
+            as_results: If True, return unrounded ScoreResult objects instead of dictionaries
+
+        Returns:
+            Score dictionaries (or ScoreResults) in the same order as the input
+        """
+        params = self._batch_params()
+        # The batch is scored as of one instant, so each distinct close date decays the same way
+        params["time_decay_memo"] = {}
+        scored_at = datetime.utcnow().isoformat() + "Z"
+        results = [self._score_opportunity(opp, include_reasoning, params, scored_at) for opp in opportunities]
+        if as_results:
+            return results
+        return [result.to_dict() for result in results]
+
+    def _score_opportunity(
+        self, opportunity: Dict[str, Any], include_reasoning: bool, params: Dict[str, Any], scored_at: str
+    ) -> ScoreResult:
+        """Score one opportunity using pre-resolved config params (see _batch_params)."""
         # Extract relevant fields
         oems = opportunity.get("oems", [])
         if not isinstance(oems, list):
@@ -355,88 +653,62 @@ class OpportunityScorer:
         contracts_recommended = opportunity.get("contracts_recommended", [])
 
         # Calculate individual scores
-        oem_score = self.calculate_oem_alignment_score(oems)
-        partner_score = self.calculate_partner_fit_score(partners, oems)
+        oems_lower, oem_score = self._normalize_oems(oems)
+        partner_score = self._partner_fit_score_lower(partners, oems_lower)
         vehicle_score = self.calculate_contract_vehicle_score(vehicle)
         govly_score = self.calculate_govly_relevance_score(tags, source)
         amount_score = self.calculate_amount_score(amount)
         stage_prob = self.calculate_stage_probability(stage)
-        time_factor = self.calculate_time_decay_factor(close_date)
+        decay_memo = params.get("time_decay_memo")
+        if decay_memo is not None and isinstance(close_date, str):
+            time_factor = decay_memo.get(close_date)
+            if time_factor is None:
+                time_factor = decay_memo[close_date] = self.calculate_time_decay_factor(close_date)
+        else:
+            time_factor = self.calculate_time_decay_factor(close_date)
 
         # Sprint 14 v2.1: Apply audited bonuses with guardrails (from config)
         # Region bonus (audited based on historical win rates)
         region_bonus = 0.0
-        region_bonuses = self._config.region_bonuses
+        region_bonuses = params["region_bonuses"]
         if region in region_bonuses:
             region_bonus = region_bonuses[region]
 
         # Customer org bonus (tiered by strategic value)
         org_bonus = 0.0
-        org_bonuses = self._config.customer_org_bonuses
         if customer_org:
-            # Check for DOD/Civilian keywords
+            # First matching DOD/Civilian keyword picks the tier
+            org_bonuses = params["org_bonuses"]
             customer_org_upper = customer_org.upper()
-            if "DOD" in customer_org_upper or "DEFENSE" in customer_org_upper:
-                org_bonus = org_bonuses.get("DOD", org_bonuses.get("Default", 2.0))
-            elif "CIVIL" in customer_org_upper or "Federal Agency A" in customer_org_upper:
-                org_bonus = org_bonuses.get("Civilian", org_bonuses.get("Default", 2.0))
-            else:
-                org_bonus = org_bonuses.get("Default", 2.0)
+            org_tier = next((tier for keyword, tier in _ORG_KEYWORDS if keyword in customer_org_upper), "Default")
+            org_bonus = org_bonuses.get(org_tier, org_bonuses.get("Default", 2.0))
 
         # CV recommendation bonus (scaled by count)
         cv_bonus = 0.0
-        cv_bonuses = self._config.cv_recommendation_bonuses
-        if contracts_recommended and len(contracts_recommended) > 0:
-            if len(contracts_recommended) == 1:
-                cv_bonus = cv_bonuses.get("single", 5.0)
-            else:  # 2+ CVs
-                cv_bonus = cv_bonuses.get("multiple", 7.0)
-
-        # Calculate weighted composite score (0-100)
-        weights = {
-            "oem_alignment": 0.25,
-            "partner_fit": 0.15,
-            "vehicle": 0.20,
-            "govly_relevance": 0.10,
-            "amount": 0.30,
-        }
-
-        raw_score = (
-            oem_score * weights["oem_alignment"]
-            + partner_score * weights["partner_fit"]
-            + vehicle_score * weights["vehicle"]
-            + govly_score * weights["govly_relevance"]
-            + amount_score * weights["amount"]
+        if contracts_recommended:
+            cv_key, cv_fallback = _CV_BONUS_SINGLE if len(contracts_recommended) == 1 else _CV_BONUS_MULTIPLE
+            cv_bonus = params["cv_bonuses"].get(cv_key, cv_fallback)
+
+        raw_score, enhanced_score, win_prob_scaled, region_bonus, org_bonus, cv_bonus = _composite_math(
+            oem_score,
+            partner_score,
+            vehicle_score,
+            govly_score,
+            amount_score,
+            stage_prob,
+            time_factor,
+            region_bonus,
+            org_bonus,
+            cv_bonus,
+            params["max_total_bonus"],
+            params["max_score"],
+            params["min_win_prob"],
         )
 
-        # Sprint 14 v2.1: Apply guardrails (from config)
-        # Cap total bonuses to prevent score inflation
-        guardrails = self._config.guardrails
-        max_total_bonus = guardrails.get("max_total_bonus", 15.0)
-        max_score = guardrails.get("max_score", 100.0)
-        min_win_prob = guardrails.get("min_win_prob", 0.0)
-
-        total_bonuses = region_bonus + org_bonus + cv_bonus
-
-        # If bonuses exceeded cap, scale them proportionally
-        if total_bonuses > max_total_bonus:
-            scale_factor = max_total_bonus / total_bonuses
-            region_bonus *= scale_factor
-            org_bonus *= scale_factor
-            cv_bonus *= scale_factor
-
-        # Apply bonuses and cap final score
-        enhanced_score = min(raw_score + region_bonus + org_bonus + cv_bonus, max_score)
-
-        # Apply stage probability and time decay to get final win probability
-        win_probability = enhanced_score * stage_prob * time_factor / 100.0
-
-        # Scale win probability to 0-100 and apply bounds
-        win_prob_scaled = min(max(win_probability * 100, min_win_prob * 100), max_score)
-
         # Build score reasoning (Phase 9)
-        score_reasoning = []
+        score_reasoning = None
         if include_reasoning:
+            score_reasoning = []
             score_reasoning.append(
                 f"Base Score: {raw_score:.1f}% (OEM:{oem_score:.0f} Partner:{partner_score:.0f} Vehicle:{vehicle_score:.0f})"
             )
@@ -451,32 +723,8 @@ class OpportunityScorer:
             score_reasoning.append(f"× Time Decay: {time_factor:.2f}")
             score_reasoning.append(f"= Win Probability: {win_prob_scaled:.1f}%")
 
-        result = {
-            "score_raw": round(raw_score, 2),
-            "score_scaled": round(enhanced_score, 2),  # Enhanced with bonuses
-            "win_prob": round(win_prob_scaled, 2),
-            "oem_alignment_score": round(oem_score, 2),
-            "partner_fit_score": round(partner_score, 2),
-            "contract_vehicle_score": round(vehicle_score, 2),
-            "govly_relevance_score": round(govly_score, 2),
-            "amount_score": round(amount_score, 2),
-            "stage_probability": round(stage_prob * 100, 2),
-            "time_decay_factor": round(time_factor, 2),
-            # Phase 9: Enhanced factors
-            "region_bonus": round(region_bonus, 2),
-            "customer_org_bonus": round(org_bonus, 2),
-            "cv_recommendation_bonus": round(cv_bonus, 2),
-            "total_bonuses_applied": round(region_bonus + org_bonus + cv_bonus, 2),
-            "weights_used": weights,
-            "scoring_model": "multi_factor_v2.1_audited",  # Sprint 14: v2.1
-            "scored_at": datetime.utcnow().isoformat() + "Z",
-        }
-
-        if include_reasoning:
-            result["score_reasoning"] = score_reasoning
-
         # Sprint 14: Save to feature store (in-memory stub)
-        opp_id = opportunity.get("id", f"temp_{datetime.utcnow().timestamp()}")
+        opp_id = opportunity["id"] if "id" in opportunity else f"temp_{time.time()}"
         save_features(
             opp_id,
             {
@@ -492,7 +740,23 @@ class OpportunityScorer:
             },
         )
 
-        return result
+        return ScoreResult(
+            score_raw=raw_score,
+            score_scaled=enhanced_score,
+            win_prob=win_prob_scaled,
+            oem_alignment_score=oem_score,
+            partner_fit_score=partner_score,
+            contract_vehicle_score=vehicle_score,
+            govly_relevance_score=govly_score,
+            amount_score=amount_score,
+            stage_probability=stage_prob * 100,
+            time_decay_factor=time_factor,
+            region_bonus=region_bonus,
+            customer_org_bonus=org_bonus,
+            cv_recommendation_bonus=cv_bonus,
+            scored_at=scored_at,
+            score_reasoning=score_reasoning,
+        )
 
     def calculate_confidence_interval(self, win_prob: float, amount: float, stage: str) -> Dict[str, float]:
         """
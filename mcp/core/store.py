@@ -2,10 +2,27 @@
 
 import json
 import os
-import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize data as indented JSON bytes with a trailing newline."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let stdlib json handle (or reject) it
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
 
 def read_json(path: str) -> Dict[str, Any]:
     """
@@ -22,6 +39,8 @@ def read_json(path: str) -> Dict[str, Any]:
         json.JSONDecodeError: If the file contains invalid JSON
     """
     file_path = Path(path)
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
     with open(file_path, "r") as f:
         return json.load(f)
 
@@ -38,19 +57,25 @@ def write_json(path: str, data: Dict[str, Any]) -> None:
         data: Dictionary to write as JSON
     """
     file_path = Path(path)
+    payload = _dumps(data)
 
     # Ensure parent directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to temporary file in the same directory
-    # Using same directory ensures atomic rename works across filesystems
-    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    # Using same directory ensures atomic rename works across filesystems;
+    # the pid/thread suffix keeps concurrent writers off each other's temp file
+    temp_path = file_path.parent / f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
 
     try:
-        # Write JSON to temp file
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")  # Add trailing newline
+        # Write JSON (with trailing newline) straight to the fd
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
 
         # Atomic rename
         os.replace(temp_path, file_path)
@@ -4,40 +4,77 @@ Centralized export logic for all entity types with improved formatting
 and atomic file writes.
 """
 
+import heapq
 import logging
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from config.obsidian_paths import get_vault_path
 
 logger = logging.getLogger(__name__)
 
+# Markdown body templates (filled with str.format_map)
+_PARTNER_TEMPLATE = (
+    "\n# {oem} Partners\n\n"
+    "## Partner Details\n\n"
+    "| Partner | Tier | Program | POC | Strength Score |\n"
+    "|---------|------|---------|-----|----------------|\n"
+    "| {name} | {tier} | {program} | {poc} | {score} |\n"
+    "\n"
+)
+_OPPORTUNITY_TEMPLATE = (
+    "\n# {name}\n\n"
+    "## Details\n\n"
+    "- **Amount**: ${amount:,.2f}\n"
+    "- **Stage**: {stage}\n"
+    "- **Close Date**: {close_date}\n"
+    "- **OEM**: {oem}\n"
+)
+
+# Forecast dashboard table rows (bound str.format of constant templates)
+_FY_ROW = "| {} | ${:,.2f} | {} |\n".format
+_TOP_OPPORTUNITY_ROW = "| [[{}]] | ${:,.0f} | {:.1f}% | {:.1f} |\n".format
+
 
 class VaultExporter:
     """Unified vault export handler."""
 
-    def __init__(self, vault_root: str):
+    def __init__(self, vault_root: str, keep_backups: bool = True):
         """Initialize exporter with vault root path.
 
         Args:
             vault_root: Path to Obsidian vault root
+            keep_backups: If True, snapshot an existing file to .bak.<timestamp> before overwriting it
         """
         self.vault_root = Path(vault_root)
-
-    def export_partner(self, partner_data: Dict[str, Any], score_data: Optional[Dict[str, Any]] = None) -> Path:
+        self.keep_backups = keep_backups
+        self._entity_dirs: Dict[str, Path] = {}
+
+    def _entity_dir(self, entity_type: str) -> Path:
+        """Resolve (once per exporter) the vault directory for an entity type."""
+        entity_dir = self._entity_dirs.get(entity_type)
+        if entity_dir is None:
+            entity_dir = self._entity_dirs[entity_type] = get_vault_path(entity_type, str(self.vault_root))
+        return entity_dir
+
+    def export_partner(
+        self, partner_data: Dict[str, Any], score_data: Optional[Dict[str, Any]] = None, now_iso: Optional[str] = None
+    ) -> Path:
         """Export partner to Obsidian markdown.
 
         Args:
             partner_data: Partner record dictionary
             score_data: Optional partner score data
+            now_iso: Optional "updated" timestamp (defaults to the current UTC time)
 
         Returns:
             Path to created file
         """
         # Determine path
-        partners_dir = get_vault_path("partners", str(self.vault_root))
+        partners_dir = self._entity_dir("partners")
         oem = partner_data.get("oem", "Unknown")
         filename = f"{oem} Partners.md"
         filepath = partners_dir / filename
@@ -46,67 +83,57 @@ class VaultExporter:
         frontmatter = {
             "type": "partner",
             "oem": oem,
-            "updated": datetime.now(timezone.utc).isoformat(),
+            "updated": now_iso or datetime.now(timezone.utc).isoformat(),
         }
 
         if score_data:
             frontmatter["strength_score"] = score_data.get("strength_score", 0)
             frontmatter["tier"] = score_data.get("tier", "")
 
-        # Build content
-        content = self._build_frontmatter(frontmatter)
-        content += f"\n# {oem} Partners\n\n"
-
-        # Partner details table
-        content += "## Partner Details\n\n"
-        content += "| Partner | Tier | Program | POC | Strength Score |\n"
-        content += "|---------|------|---------|-----|----------------|\n"
-
-        if score_data:
-            name = partner_data.get("name", "")
-            tier = partner_data.get("tier", "")
-            program = partner_data.get("program", "")
-            poc = partner_data.get("poc", "-")
-            score = score_data.get("strength_score", 0)
-            content += f"| {name} | {tier} | {program} | {poc} | {score:.1f} |\n"
-        else:
-            name = partner_data.get("name", "")
-            tier = partner_data.get("tier", "")
-            program = partner_data.get("program", "")
-            poc = partner_data.get("poc", "-")
-            content += f"| {name} | {tier} | {program} | {poc} | - |\n"
-
-        content += "\n"
+        # Build content with the partner details table
+        parts = [
+            self._build_frontmatter(frontmatter),
+            _PARTNER_TEMPLATE.format_map(
+                {
+                    "oem": oem,
+                    "name": partner_data.get("name", ""),
+                    "tier": partner_data.get("tier", ""),
+                    "program": partner_data.get("program", ""),
+                    "poc": partner_data.get("poc", "-"),
+                    "score": f"{score_data.get('strength_score', 0):.1f}" if score_data else "-",
+                }
+            ),
+        ]
 
         # Capabilities section
         if score_data and score_data.get("capabilities"):
-            content += "## Capabilities\n\n"
-            for cap in score_data["capabilities"]:
-                content += f"- {cap}\n"
-            content += "\n"
+            parts.append("## Capabilities\n\n")
+            parts.extend(f"- {cap}\n" for cap in score_data["capabilities"])
+            parts.append("\n")
 
         # Notes section
         notes = partner_data.get("notes")
         if notes:
-            content += "## Notes\n\n"
-            content += f"{notes}\n\n"
+            parts.append("## Notes\n\n")
+            parts.append(f"{notes}\n\n")
 
         # Write file atomically
-        self._write_file_atomic(filepath, content)
+        self._write_file_atomic(filepath, "".join(parts))
 
         return filepath
 
-    def export_opportunity(self, opportunity: Dict[str, Any]) -> Path:
+    def export_opportunity(self, opportunity: Dict[str, Any], now_iso: Optional[str] = None) -> Path:
         """Export opportunity to Obsidian markdown.
 
         Args:
             opportunity: Opportunity dictionary
+            now_iso: Optional "updated" timestamp (defaults to the current UTC time)
 
         Returns:
             Path to created file
         """
         # Determine path based on FY
-        opps_dir = get_vault_path("opportunities", str(self.vault_root))
+        opps_dir = self._entity_dir("opportunities")
         name = opportunity.get("name", "Unknown")
         filename = f"{name}.md"
 
@@ -132,7 +159,7 @@ class VaultExporter:
             "close_date": close_date,
             "stage": opportunity.get("stage", ""),
             "oem": opportunity.get("oem", ""),
-            "updated": datetime.now(timezone.utc).isoformat(),
+            "updated": now_iso or datetime.now(timezone.utc).isoformat(),
         }
 
         # Add forecast fields if present
@@ -141,98 +168,112 @@ class VaultExporter:
         if "score_raw" in opportunity:
             frontmatter["score_raw"] = opportunity["score_raw"]
 
-        # Build content
-        content = self._build_frontmatter(frontmatter)
-        content += f"\n# {name}\n\n"
-
-        # Details section
-        content += "## Details\n\n"
-        content += f"- **Amount**: ${opportunity.get('amount', 0):,.2f}\n"
-        content += f"- **Stage**: {opportunity.get('stage', 'Unknown')}\n"
-        content += f"- **Close Date**: {close_date or 'TBD'}\n"
-        content += f"- **OEM**: {opportunity.get('oem', 'Unknown')}\n"
+        # Build content with the details section
+        parts = [
+            self._build_frontmatter(frontmatter),
+            _OPPORTUNITY_TEMPLATE.format_map(
+                {
+                    "name": name,
+                    "amount": opportunity.get("amount", 0),
+                    "stage": opportunity.get("stage", "Unknown"),
+                    "close_date": close_date or "TBD",
+                    "oem": opportunity.get("oem", "Unknown"),
+                }
+            ),
+        ]
 
         if "customer" in opportunity:
-            content += f"- **Customer**: {opportunity['customer']}\n"
+            parts.append(f"- **Customer**: {opportunity['customer']}\n")
 
-        content += "\n"
+        parts.append("\n")
 
         # Partner attribution
         partners = opportunity.get("partner_attribution", [])
         if partners:
-            content += "## Partner Attribution\n\n"
-            for partner in partners:
-                content += f"- [[{partner}]]\n"
-            content += "\n"
+            parts.append("## Partner Attribution\n\n")
+            parts.extend(f"- [[{partner}]]\n" for partner in partners)
+            parts.append("\n")
 
         # Write file atomically
-        self._write_file_atomic(filepath, content)
+        self._write_file_atomic(filepath, "".join(parts))
 
         return filepath
 
-    def export_forecast_dashboard(self, forecast_data: Dict[str, Any]) -> Path:
+    def export_batch(self, opportunities: List[Dict[str, Any]]) -> List[Path]:
+        """Export many opportunities sharing one "updated" timestamp.
+
+        Args:
+            opportunities: Opportunity dictionaries
+
+        Returns:
+            Paths to created files, in input order
+        """
+        now_iso = datetime.now(timezone.utc).isoformat()
+        return [self.export_opportunity(opp, now_iso) for opp in opportunities]
+
+    def export_forecast_dashboard(self, forecast_data: Dict[str, Any], now_iso: Optional[str] = None) -> Path:
         """Export forecast dashboard to Obsidian.
 
         Args:
             forecast_data: Forecast summary data
+            now_iso: Optional "updated" timestamp (defaults to the current UTC time)
 
         Returns:
             Path to created file
         """
-        dashboards_dir = get_vault_path("dashboards", str(self.vault_root))
+        dashboards_dir = self._entity_dir("dashboards")
         filepath = dashboards_dir / "Forecast Dashboard.md"
 
         # Build frontmatter
         frontmatter = {
             "type": "dashboard",
             "category": "forecast",
-            "updated": datetime.now(timezone.utc).isoformat(),
+            "updated": now_iso or datetime.now(timezone.utc).isoformat(),
         }
 
         # Build content
-        content = self._build_frontmatter(frontmatter)
-        content += "\n# Forecast Dashboard\n\n"
+        parts = [self._build_frontmatter(frontmatter), "\n# Forecast Dashboard\n\n"]
 
         # Summary section
         summary = forecast_data.get("summary", {})
-        content += "## Summary\n\n"
-        content += f"- **Total Opportunities**: {summary.get('total_opportunities', 0)}\n"
-        content += f"- **Total Pipeline**: ${summary.get('total_projected_amount', 0):,.2f}\n"
-        content += f"- **Avg Win Probability**: {summary.get('avg_win_probability', 0):.1f}%\n"
-        content += "\n"
+        parts.append("## Summary\n\n")
+        parts.append(f"- **Total Opportunities**: {summary.get('total_opportunities', 0)}\n")
+        parts.append(f"- **Total Pipeline**: ${summary.get('total_projected_amount', 0):,.2f}\n")
+        parts.append(f"- **Avg Win Probability**: {summary.get('avg_win_probability', 0):.1f}%\n")
+        parts.append("\n")
 
         # FY projections
-        content += "## FY Projections\n\n"
-        content += "| Fiscal Year | Projected Amount | Opportunity Count |\n"
-        content += "|-------------|------------------|-------------------|\n"
+        parts.append("## FY Projections\n\n")
+        parts.append("| Fiscal Year | Projected Amount | Opportunity Count |\n")
+        parts.append("|-------------|------------------|-------------------|\n")
 
         fy_breakdown = forecast_data.get("fiscal_year_breakdown", {})
         for fy, data in sorted(fy_breakdown.items()):
             amount = data.get("total_amount", 0)
             count = data.get("count", 0)
-            content += f"| {fy} | ${amount:,.2f} | {count} |\n"
+            parts.append(_FY_ROW(fy, amount, count))
 
-        content += "\n"
+        parts.append("\n")
 
         # Top opportunities
         opportunities = forecast_data.get("opportunities", [])
         if opportunities:
-            content += "## Top Opportunities\n\n"
-            content += "| Opportunity | Amount | Win Prob | Score |\n"
-            content += "|-------------|--------|----------|-------|\n"
+            parts.append("## Top Opportunities\n\n")
+            parts.append("| Opportunity | Amount | Win Prob | Score |\n")
+            parts.append("|-------------|--------|----------|-------|\n")
 
-            top_opps = sorted(opportunities, key=lambda x: x.get("win_prob", 0), reverse=True)[:20]
+            top_opps = heapq.nlargest(20, opportunities, key=lambda x: x.get("win_prob", 0))
             for opp in top_opps:
                 name = opp.get("name", "Unknown")
                 amount = opp.get("amount", 0)
                 win_prob = opp.get("win_prob", 0)
                 score = opp.get("score_raw", 0)
-                content += f"| [[{name}]] | ${amount:,.0f} | {win_prob:.1f}% | {score:.1f} |\n"
+                parts.append(_TOP_OPPORTUNITY_ROW(name, amount, win_prob, score))
 
-            content += "\n"
+            parts.append("\n")
 
         # Write file atomically
-        self._write_file_atomic(filepath, content)
+        self._write_file_atomic(filepath, "".join(parts))
 
         return filepath
 
@@ -268,10 +309,14 @@ class VaultExporter:
         # Ensure directory exists
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Backup existing file
-        if filepath.exists():
+        # Backup existing file; a hard link is enough since the rename below swaps in a new inode
+        if self.keep_backups and filepath.exists():
             backup_path = filepath.with_suffix(f".bak.{int(datetime.now().timestamp())}")
-            shutil.copy2(filepath, backup_path)
+            try:
+                os.link(filepath, backup_path)
+            except OSError:
+                # Hard links unsupported (or backup already exists): fall back to a copy
+                shutil.copy2(filepath, backup_path)
 
         # Write to temp file first
         temp_path = filepath.with_suffix(".tmp")
@@ -284,6 +329,34 @@ class VaultExporter:
         logger.info(f"Exported to {filepath}")
 
 
+def _list_md_files(root: Path) -> List[str]:
+    """Names of all *.md entries under root, in the same order as root.rglob("*.md").
+
+    Walks with os.scandir and keeps only names, skipping the Path object rglob builds per match.
+    Symlinked directories are listed but not descended into, as with rglob.
+    """
+    names: List[str] = []
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md"):
+                        names.append(entry.name)
+                    try:
+                        if entry.is_dir() and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            continue
+        # Depth-first, visiting subdirectories in scandir order
+        pending.extend(reversed(subdirs))
+    return names
+
+
 def preview_sync_operations(vault_root: str, entity_type: str) -> Dict[str, Any]:
     """Preview what files would be created/updated during sync.
 
@@ -299,7 +372,7 @@ def preview_sync_operations(vault_root: str, entity_type: str) -> Dict[str, Any]
     # List existing files
     existing_files = []
     if entity_dir.exists():
-        existing_files = [f.name for f in entity_dir.rglob("*.md")]
+        existing_files = _list_md_files(entity_dir)
 
     # Placeholder for what would be created (actual logic would load from store)
     return {
@@ -7,15 +7,62 @@ opportunities. It complements the webhook integration by enabling proactive poll
 
 import logging
 import os
+import random
+import time
+import uuid
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx
+except ImportError:  # optional; HTTP/1.1 keep-alive is the fallback
+    _HTTP2 = False
+else:
+    _HTTP2 = True
 
 logger = logging.getLogger(__name__)
 
+# Responses retried with exponential backoff before surfacing as errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Decorrelated-jitter backoff bounds for those retries (seconds)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+# Client-side pacing: sliding one-minute request window plus an AIMD gap between
+# requests that doubles on 429/5xx and shrinks additively on success
+_RPM_WINDOW_SECONDS = 60.0
+_THROTTLE_FRACTION = 0.1
+_MIN_GAP_STEP = 0.25
+_MAX_GAP = 30.0
+
+# Default cache lifetimes for rarely-changing reference data (seconds)
+_REFERENCE_TTL = 3600.0
+_HEALTH_TTL = 30.0
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@lru_cache(maxsize=8)
+def _since_window(since_hours: int, bucket_minute: int) -> str:
+    """ISO "since" filter for the last since_hours, aligned to the minute bucket."""
+    return (_EPOCH + timedelta(minutes=bucket_minute - since_hours * 60)).isoformat() + "Z"
+
+
+def _since(since_hours: int) -> str:
+    """Since filter shared by every request within the same UTC minute."""
+    return _since_window(since_hours, int(time.time() // 60))
+
 
 class GovlyAPIError(Exception):
     """Base exception for Govly API errors."""
@@ -55,6 +102,7 @@ class GovlyClient:
         base_url: str = "https://api.govly.com/v1",
         timeout: int = 30,
         max_retries: int = 3,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         """
         Initialize Govly API client.
@@ -64,6 +112,7 @@ class GovlyClient:
             base_url: API base URL
             timeout: Request timeout in seconds
             max_retries: Number of retry attempts for failed requests
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
         """
         self.api_key = api_key or os.getenv("GOVLY_API_KEY")
         if not self.api_key:
@@ -71,26 +120,41 @@ class GovlyClient:
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-
-        # Create session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET", "POST"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # Set default headers
-        self.session.headers.update(
-            {
+        self.max_retries = max_retries
+
+        # Rate-limit state learned from X-RateLimit-* headers
+        self._rpm_window: deque = deque()
+        self._rpm_limit: Optional[int] = None
+        self._rpm_remaining: Optional[int] = None
+        self._min_gap = 0.0
+        self._last_max_age: Optional[float] = None
+
+        # In-process TTL cache: key -> (expires_at monotonic, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+
+        # Endpoints discovered on first use, so fallbacks aren't re-probed per call
+        self._opps_endpoint: Optional[str] = None
+        self._has_health_endpoint: Optional[bool] = None
+
+        # Pooled keep-alive connections (HTTP/2 when h2 is installed); the transport
+        # retries connection failures, status-based retries happen in _request
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                http2=_HTTP2,
+                retries=max_retries,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        self.session = httpx.Client(
+            transport=transport,
+            timeout=timeout,
+            headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
                 "User-Agent": "DealCraft/2.0",
-            }
+            },
         )
 
-        logger.info(f"Initialized Govly API client (base_url={self.base_url})")
+        logger.info(f"Initialized Govly API client (base_url={self.base_url}, http2={_HTTP2})")
 
     def _request(
         self,
@@ -118,20 +182,39 @@ class GovlyClient:
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
+        # One key per logical POST so a retried write is applied at most once
+        headers = {"Idempotency-Key": uuid.uuid4().hex} if method.upper() == "POST" else None
+
         try:
             logger.debug(f"{method} {url} params={params}")
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                timeout=self.timeout,
-            )
+            delay = _BACKOFF_BASE
+            for attempt in range(self.max_retries + 1):
+                self._wait_if_throttled()
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+                self._record_response(response)
+                if response.status_code not in _RETRY_STATUSES or attempt == self.max_retries:
+                    break
+
+                # Decorrelated jitter keeps clients sharing a quota from retrying in lockstep;
+                # Retry-After, when given, is a floor
+                delay = min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, delay * 3))
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+                logger.debug(f"Govly API returned {response.status_code}, retrying in {delay:.2f}s")
+                time.sleep(delay)
 
             # Handle rate limiting
             if response.status_code == 429:
                 retry_after = response.headers.get("Retry-After")
-                retry_after_int = int(retry_after) if retry_after else 60
+                # Retry-After may also be an HTTP-date; fall back to the default wait
+                retry_after_int = int(retry_after) if retry_after and retry_after.isdigit() else 60
                 logger.warning(f"Rate limit hit, retry after {retry_after_int}s")
                 raise GovlyRateLimitError(f"Rate limit exceeded. Retry after {retry_after_int}s", retry_after=retry_after_int)
 
@@ -146,15 +229,80 @@ class GovlyClient:
                 logger.error(error_msg)
                 raise GovlyAPIError(error_msg)
 
-            return response.json()
-
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error(f"Request timeout after {self.timeout}s")
             raise GovlyAPIError(f"Request timeout after {self.timeout}s")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request failed: {e}")
             raise GovlyAPIError(f"Request failed: {e}")
 
+        try:
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+        except ValueError as e:
+            logger.error(f"Invalid JSON from Govly API: {e}")
+            raise GovlyAPIError(f"Invalid JSON response: {e}")
+
+    def _wait_if_throttled(self) -> None:
+        """Sleep before a request when the provider's rate budget is nearly spent."""
+        window = self._rpm_window
+        now = time.monotonic()
+        while window and now - window[0] >= _RPM_WINDOW_SECONDS:
+            window.popleft()
+
+        delay = 0.0
+        if window:
+            delay = self._min_gap - (now - window[-1])
+            limit = self._rpm_limit
+            if limit:
+                low = self._rpm_remaining is not None and self._rpm_remaining < limit * _THROTTLE_FRACTION
+                if len(window) >= limit or low:
+                    # Wait for the oldest request to leave the window
+                    delay = max(delay, _RPM_WINDOW_SECONDS - (now - window[0]))
+
+        if delay > 0:
+            logger.debug(f"Throttling Govly request for {delay:.2f}s")
+            time.sleep(delay)
+        window.append(time.monotonic())
+
+    def _record_response(self, response: httpx.Response) -> None:
+        """Update rate-limit state from response headers and adjust pacing."""
+        headers = response.headers
+        limit = headers.get("X-RateLimit-Limit")
+        if limit and limit.isdigit():
+            self._rpm_limit = int(limit)
+        remaining = headers.get("X-RateLimit-Remaining")
+        self._rpm_remaining = int(remaining) if remaining and remaining.isdigit() else None
+
+        self._last_max_age = None
+        for directive in headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            if name.lower() == "max-age" and value.isdigit():
+                self._last_max_age = float(value)
+
+        if response.status_code in _RETRY_STATUSES:
+            self._min_gap = min(_MAX_GAP, max(_MIN_GAP_STEP, self._min_gap * 2))
+        elif response.status_code < 400 and self._min_gap:
+            self._min_gap = max(0.0, self._min_gap - _MIN_GAP_STEP)
+
+    def _cached(self, key: str, ttl: float, fetch: Callable[[], Any], refresh: bool = False) -> Any:
+        """Return a cached value, calling fetch when missing, expired, or refresh is set.
+
+        A Cache-Control max-age on the fetching response overrides ttl.
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and not refresh and now < entry[0]:
+            return entry[1]
+
+        self._last_max_age = None
+        value = fetch()
+        if self._last_max_age is not None:
+            ttl = self._last_max_age
+        self._cache[key] = (now + ttl, value)
+        return value
+
     def fetch_opportunities(
         self,
         limit: int = 100,
@@ -200,8 +348,7 @@ class GovlyClient:
 
         # Time-based filtering
         if since_hours:
-            since_dt = datetime.utcnow() - timedelta(hours=since_hours)
-            params["since"] = since_dt.isoformat() + "Z"
+            params["since"] = _since(since_hours)
         elif since_date:
             params["since"] = since_date
 
@@ -216,25 +363,77 @@ class GovlyClient:
             params["status"] = status
 
         try:
+            if self._opps_endpoint:
+                return self._fetch_listing(self._opps_endpoint, params)
+
             # Attempt common REST endpoint patterns
             # Try /opportunities first (most common)
             try:
-                data = self._request("GET", "/opportunities", params=params)
-                logger.info(f"Fetched {len(data.get('opportunities', []))} opportunities from Govly")
-                return data.get("opportunities", data.get("data", []))
+                opps = self._fetch_listing("/opportunities", params)
+                self._opps_endpoint = "/opportunities"
             except GovlyAPIError as e:
                 # If /opportunities doesn't work, try /contracts
                 if "404" in str(e) or "not found" in str(e).lower():
                     logger.debug("/opportunities not found, trying /contracts")
-                    data = self._request("GET", "/contracts", params=params)
-                    logger.info(f"Fetched {len(data.get('contracts', []))} opportunities from Govly")
-                    return data.get("contracts", data.get("data", []))
-                raise
+                    opps = self._fetch_listing("/contracts", params)
+                    self._opps_endpoint = "/contracts"
+                else:
+                    raise
+            return opps
 
         except GovlyAPIError as e:
             logger.error(f"Failed to fetch opportunities: {e}")
             raise
 
+    def _fetch_listing(self, endpoint: str, params: Dict) -> List[Dict]:
+        """Fetch one page from an opportunity listing endpoint."""
+        key = endpoint.lstrip("/")
+        data = self._request("GET", endpoint, params=params)
+        logger.info(f"Fetched {len(data.get(key, []))} opportunities from Govly")
+        return data.get(key, data.get("data", []))
+
+    def iter_opportunities(
+        self,
+        since_hours: Optional[int] = None,
+        page_size: int = 200,
+        max_pages: Optional[int] = None,
+        **filters,
+    ) -> Iterator[Dict]:
+        """
+        Yield opportunities one at a time across paginated requests.
+
+        Args:
+            since_hours: Fetch opportunities posted in last N hours
+            page_size: Opportunities per request (default: 200)
+            max_pages: Stop after this many pages (default: no limit)
+            **filters: Other fetch_opportunities filters (agencies, status, ...)
+
+        Yields:
+            Opportunity dictionaries
+
+        Paging also stops at a page with no unseen opportunities, so an
+        endpoint that ignores ``offset`` cannot loop forever.
+        """
+        if since_hours:
+            # Pin the window once so later pages don't drift
+            filters["since_date"] = _since(since_hours)
+
+        seen = set()
+        offset = 0
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            batch = self.fetch_opportunities(limit=page_size, offset=offset, **filters)
+            page_keys = {opp.get("id") or repr(opp) for opp in batch}
+            if batch and page_keys <= seen:
+                logger.warning(f"Opportunity page at offset {offset} repeats earlier results, stopping")
+                break
+            seen |= page_keys
+            yield from batch
+            pages += 1
+            if len(batch) < page_size:
+                break
+            offset += page_size
+
     def get_opportunity(self, opportunity_id: str) -> Optional[Dict]:
         """
         Fetch single opportunity by ID.
@@ -256,6 +455,36 @@ class GovlyClient:
             logger.error(f"Failed to fetch opportunity {opportunity_id}: {e}")
             raise
 
+    def get_opportunities_bulk(self, ids: List[str], chunk_size: int = 100) -> List[Dict]:
+        """
+        Fetch many opportunities by ID, chunk_size IDs per request.
+
+        Args:
+            ids: Govly opportunity IDs
+            chunk_size: Maximum IDs per request (default: 100)
+
+        Returns:
+            List of opportunity dictionaries (IDs not found are omitted;
+            rows for IDs that were not requested are dropped)
+        """
+        results: List[Dict] = []
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            try:
+                data = self._request("GET", "/opportunities", params={"ids": ",".join(chunk), "limit": len(chunk)})
+            except GovlyAPIError as e:
+                logger.error(f"Failed to fetch {len(chunk)} opportunities by ID: {e}")
+                raise
+            requested = set(chunk)
+            rows = data.get("opportunities", data.get("data", []))
+            matched = [opp for opp in rows if str(opp.get("id")) in requested]
+            if len(matched) < len(rows):
+                logger.warning(f"Govly returned {len(rows) - len(matched)} unrequested opportunities for an ID lookup, ignoring them")
+            results.extend(matched)
+
+        logger.info(f"Fetched {len(results)} of {len(ids)} requested opportunities")
+        return results
+
     def search_opportunities(
         self,
         query: str,
@@ -289,13 +518,19 @@ class GovlyClient:
             logger.error(f"Search failed for '{query}': {e}")
             raise
 
-    def get_contract_vehicles(self) -> List[Dict]:
+    def get_contract_vehicles(self, refresh: bool = False) -> List[Dict]:
         """
-        Get list of available contract vehicles.
+        Get list of available contract vehicles (cached for an hour).
+
+        Args:
+            refresh: Bypass the cache and refetch
 
         Returns:
             List of contract vehicle dictionaries
         """
+        return self._cached("contract-vehicles", _REFERENCE_TTL, self._fetch_contract_vehicles, refresh)
+
+    def _fetch_contract_vehicles(self) -> List[Dict]:
         try:
             data = self._request("GET", "/contract-vehicles")
             logger.info(f"Fetched {len(data.get('vehicles', []))} contract vehicles")
@@ -304,13 +539,19 @@ class GovlyClient:
             logger.error(f"Failed to fetch contract vehicles: {e}")
             raise
 
-    def get_agencies(self) -> List[Dict]:
+    def get_agencies(self, refresh: bool = False) -> List[Dict]:
         """
-        Get list of federal agencies.
+        Get list of federal agencies (cached for an hour).
+
+        Args:
+            refresh: Bypass the cache and refetch
 
         Returns:
             List of agency dictionaries
         """
+        return self._cached("agencies", _REFERENCE_TTL, self._fetch_agencies, refresh)
+
+    def _fetch_agencies(self) -> List[Dict]:
         try:
             data = self._request("GET", "/agencies")
             logger.info(f"Fetched {len(data.get('agencies', []))} agencies")
@@ -319,24 +560,35 @@ class GovlyClient:
             logger.error(f"Failed to fetch agencies: {e}")
             raise
 
-    def health_check(self) -> bool:
+    def health_check(self, refresh: bool = False) -> bool:
         """
-        Check if API is accessible and authenticated.
+        Check if API is accessible and authenticated (cached for 30 seconds).
+
+        Args:
+            refresh: Bypass the cache and recheck
 
         Returns:
             True if API is healthy, False otherwise
         """
+        return self._cached("health", _HEALTH_TTL, self._check_health, refresh)
+
+    def _check_health(self) -> bool:
+        if self._has_health_endpoint is not False:
+            try:
+                # Try a lightweight endpoint
+                data = self._request("GET", "/health")
+                self._has_health_endpoint = True
+                return data.get("status") == "ok"
+            except GovlyAPIError as e:
+                if "404" in str(e):
+                    self._has_health_endpoint = False
+
+        # If /health doesn't exist, try fetching with limit=1
         try:
-            # Try a lightweight endpoint
-            data = self._request("GET", "/health")
-            return data.get("status") == "ok"
+            self.fetch_opportunities(limit=1)
+            return True
         except GovlyAPIError:
-            # If /health doesn't exist, try fetching with limit=1
-            try:
-                self.fetch_opportunities(limit=1)
-                return True
-            except GovlyAPIError:
-                return False
+            return False
 
     def close(self):
         """Close the HTTP session."""
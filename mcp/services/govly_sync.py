@@ -9,15 +9,18 @@ with webhook-ingested data in state.json. It provides:
 - Sync status reporting
 """
 
+import hashlib
 import json
 import logging
 import os
 import threading
 import time
+import unicodedata
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional, Set
 
+from mcp.core.store import read_json, write_json
 from mcp.integrations.govly_client import GovlyAPIError, GovlyClient, GovlyRateLimitError
 
 logger = logging.getLogger(__name__)
@@ -41,6 +44,7 @@ class GovlySyncService:
         state_file: str = "data/state.json",
         sync_interval: int = 300,  # 5 minutes
         fetch_hours: int = 48,  # Fetch last 48 hours
+        max_pages: int = 10,  # Up to 2000 opportunities per sync
         enabled: bool = True,
     ):
         """
@@ -51,17 +55,20 @@ class GovlySyncService:
             state_file: Path to state.json
             sync_interval: Seconds between sync runs (default: 300 = 5 minutes)
             fetch_hours: Hours of history to fetch (default: 48)
+            max_pages: Pages of 200 opportunities to fetch per sync (default: 10)
             enabled: Whether service is enabled (default: True)
         """
         self.api_key = api_key or os.getenv("GOVLY_API_KEY")
         self.state_file = Path(state_file)
         self.sync_interval = sync_interval
         self.fetch_hours = fetch_hours
+        self.max_pages = max_pages
         self.enabled = enabled
 
         # Service state
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         self.last_sync_time: Optional[datetime] = None
         self.last_sync_success: bool = False
         self.last_sync_error: Optional[str] = None
@@ -71,6 +78,10 @@ class GovlySyncService:
         # Govly client (lazy init)
         self._client: Optional[GovlyClient] = None
 
+        # Known opportunity IDs, loaded once and kept current in memory so a
+        # sync with nothing new never touches state.json
+        self._existing_ids: Set[str] = self._get_existing_ids(self._load_state())
+
         logger.info(f"Initialized Govly sync service (interval={sync_interval}s, enabled={enabled})")
 
     @property
@@ -91,6 +102,7 @@ class GovlySyncService:
             return
 
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._run_loop, daemon=True, name="GovlySync")
         self.thread.start()
         logger.info("Govly sync service started")
@@ -102,12 +114,14 @@ class GovlySyncService:
 
         logger.info("Stopping Govly sync service...")
         self.running = False
+        self._stop_event.set()
 
         if self.thread:
             self.thread.join(timeout=10)
 
         if self._client:
             self._client.close()
+            self._client = None  # a restarted service gets a fresh connection pool
 
         logger.info("Govly sync service stopped")
 
@@ -121,12 +135,12 @@ class GovlySyncService:
         # Then run on schedule
         while self.running:
             try:
-                time.sleep(self.sync_interval)
-                if self.running:  # Check again after sleep
-                    self._sync_opportunities()
+                if self._stop_event.wait(self.sync_interval):
+                    break
+                self._sync_opportunities()
             except Exception as e:
                 logger.error(f"Unexpected error in sync loop: {e}", exc_info=True)
-                time.sleep(60)  # Wait before retrying after fatal error
+                self._stop_event.wait(60)  # Wait before retrying after fatal error
 
         logger.info("Govly sync loop exited")
 
@@ -136,29 +150,32 @@ class GovlySyncService:
         start_time = time.time()
 
         try:
-            # Fetch opportunities from API
-            opportunities = self.client.fetch_opportunities(
-                limit=200,
-                since_hours=self.fetch_hours,
-            )
-
-            # Load current state
-            state = self._load_state()
-            existing_ids = self._get_existing_ids(state)
-
-            # Filter to new opportunities only
-            new_opps = []
-            for opp in opportunities:
+            # Stream pages from the API, keeping only opportunities not seen before
+            existing_ids = self._existing_ids
+            candidates = []
+            for opp in self.client.iter_opportunities(since_hours=self.fetch_hours, page_size=200, max_pages=self.max_pages):
                 opp_id = self._generate_id(opp)
                 if opp_id not in existing_ids:
-                    # Normalize to standard format
-                    normalized = self._normalize_opportunity(opp, opp_id)
-                    new_opps.append(normalized)
+                    candidates.append((opp_id, opp))
+
+            new_opps = []
+            if candidates:
+                # Webhooks also write state.json, so pick up their IDs before merging
+                state = self._load_state()
+                created_at = datetime.now(timezone.utc).isoformat()
+                existing_ids |= self._get_existing_ids(state)
+                batch_ids = set()
+                for opp_id, opp in candidates:
+                    if opp_id not in existing_ids and opp_id not in batch_ids:
+                        # Normalize to standard format
+                        new_opps.append(self._normalize_opportunity(opp, opp_id, created_at))
+                        batch_ids.add(opp_id)
 
             # Add new opportunities to state
             if new_opps:
                 state.setdefault("opportunities", []).extend(new_opps)
                 self._save_state(state)
+                existing_ids |= batch_ids
                 logger.info(f"Added {len(new_opps)} new Govly opportunities to state")
                 self.opportunities_added += len(new_opps)
             else:
@@ -179,7 +196,7 @@ class GovlySyncService:
             self.last_sync_error = f"Rate limited (retry in {e.retry_after}s)"
             # Wait for rate limit to reset
             if e.retry_after:
-                time.sleep(e.retry_after)
+                self._stop_event.wait(e.retry_after)
 
         except GovlyAPIError as e:
             logger.error(f"Govly API error during sync: {e}")
@@ -243,21 +260,15 @@ class GovlySyncService:
             return {"opportunities": [], "recent_actions": []}
 
         try:
-            with open(self.state_file, "r") as f:
-                return json.load(f)
+            return read_json(self.state_file)
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load state.json: {e}")
             return {"opportunities": [], "recent_actions": []}
 
     def _save_state(self, state: Dict):
         """Atomically save state.json."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        temp_file = self.state_file.with_suffix(".tmp")
-
         try:
-            with open(temp_file, "w") as f:
-                json.dump(state, f, indent=2)
-            temp_file.replace(self.state_file)
+            write_json(self.state_file, state)
         except IOError as e:
             logger.error(f"Failed to save state.json: {e}")
             raise
@@ -269,21 +280,23 @@ class GovlySyncService:
     def _generate_id(self, opp: Dict) -> str:
         """Generate unique ID from opportunity data."""
         # Try various ID fields that might exist
-        external_id = (
-            opp.get("id")
-            or opp.get("event_id")
-            or opp.get("opportunity_id")
-            or opp.get("govly_id")
-            or str(hash(opp.get("title", "") + str(opp.get("posted_date", ""))))
-        )
+        external_id = opp.get("id") or opp.get("event_id") or opp.get("opportunity_id") or opp.get("govly_id") or self._content_hash(opp)
         return f"govly_{external_id}".lower().replace(" ", "_")
 
-    def _normalize_opportunity(self, opp: Dict, opp_id: str) -> Dict:
+    @staticmethod
+    def _content_hash(opp: Dict) -> str:
+        """Stable hash of title/posted date/agency for opportunities without an ID."""
+        title = unicodedata.normalize("NFKC", opp.get("title") or "").strip().lower()
+        agency = opp.get("agency") or opp.get("agency_name") or ""
+        key = f"{title}|{opp.get('posted_date') or ''}|{agency}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _normalize_opportunity(self, opp: Dict, opp_id: str, created_at: Optional[str] = None) -> Dict:
         """
         Normalize API opportunity to standard format.
 
         Converts various API field names to our standard schema matching
-        the webhook format.
+        the webhook format. Pass created_at to share one timestamp across a batch.
         """
         return {
             "id": opp_id,
@@ -296,7 +309,7 @@ class GovlySyncService:
             "close_date": opp.get("close_date") or opp.get("due_date"),
             "source_url": opp.get("source_url") or opp.get("url") or opp.get("link"),
             "triage": True,  # All API-fetched opps start in triage
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": created_at or datetime.now(timezone.utc).isoformat(),
             "ingestion_method": "api_poll",  # vs "webhook"
         }
 
@@ -306,12 +319,10 @@ class GovlySyncService:
             return None
 
         try:
-            dt = datetime.fromisoformat(close_date.replace("Z", "+00:00"))
-            if dt.month >= 10:
-                return f"FY{dt.year + 1}"
-            else:
-                return f"FY{dt.year}"
-        except (ValueError, AttributeError):
+            # Python 3.11+ parses a trailing "Z" natively; FY starts in October
+            dt = datetime.fromisoformat(close_date)
+            return f"FY{dt.year + (dt.month >= 10)}"
+        except (ValueError, TypeError):
             return None
 
 
@@ -256,6 +256,20 @@ class TestContractVehicleStore:
         score = cv_store.get_priority_score("NASA SOLUTIONS")
         assert score == 92.0
 
+    def test_get_by_priority(self, cv_store):
+        """Test CVs come back highest priority first and the index follows updates."""
+        cv_store.add(ContractVehicle(id="a", name="A", priority_score=80.0))
+        cv_store.add(ContractVehicle(id="b", name="B", priority_score=95.0))
+        cv_store.add(ContractVehicle(id="c", name="C", priority_score=80.0))
+        cv_store.delete("b")
+
+        assert [cv.id for cv in cv_store.get_by_priority()] == ["b", "a", "c"]
+        assert [cv.id for cv in cv_store.get_by_priority(active_only=True)] == ["a", "c"]
+        assert [cv.id for cv in cv_store.get_by_priority(min_priority=90.0)] == ["b"]
+
+        cv_store.update("c", ContractVehicle(id="c", name="C", priority_score=99.0))
+        assert [cv.id for cv in cv_store.get_by_priority()] == ["c", "b", "a"]
+
     def test_get_priority_score_not_found(self, cv_store):
         """Test getting priority score for non-existent CV returns 0."""
         score = cv_store.get_priority_score("Unknown")
@@ -424,6 +438,36 @@ class TestEntityStoreSearch:
         active_results = oem_store.search(tier="Gold", active=True)
         assert len(active_results) == 0
 
+    def test_get_all_with_filters(self, oem_store):
+        """Test get_all applies field filters alongside active_only"""
+        oem_store.delete("cisco")  # Mark inactive
+
+        assert [o.id for o in oem_store.get_all(tier="Strategic")] == ["ms", "cisco"]
+        assert [o.id for o in oem_store.get_all(active_only=True, tier="Strategic")] == ["ms"]
+        assert len(oem_store.get_all(tier=None)) == 3
+        assert oem_store.get_all(no_such_field="x") == []
+
+    def test_get_all_index_follows_updates(self, oem_store):
+        """Test filtered get_all sees tier changes and new entities"""
+        assert [o.id for o in oem_store.get_all(tier="Gold")] == ["dell"]
+
+        oem = oem_store.get("ms")
+        oem.tier = "Gold"
+        oem_store.update("ms", oem)
+        oem_store.add(OEM(id="hp", name="HP", tier="Gold"))
+
+        assert [o.id for o in oem_store.get_all(tier="Gold")] == ["ms", "dell", "hp"]
+        assert [o.id for o in oem_store.get_all(tier="Strategic")] == ["cisco"]
+
+    def test_filters_recheck_live_values(self, oem_store):
+        """Test an in-place edit without save() is not returned under its old value"""
+        assert [o.id for o in oem_store.search(tier="Gold")] == ["dell"]
+
+        oem_store.get("dell").tier = "Silver"
+
+        assert oem_store.search(tier="Gold") == []
+        assert oem_store.get_all(tier="Gold") == []
+
 
 class TestBackupAndRecovery:
     """Tests for backup functionality."""
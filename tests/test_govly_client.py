@@ -0,0 +1,292 @@
+"""Tests for the Govly API client"""
+
+import httpx
+import pytest
+
+from mcp.integrations import govly_client
+from mcp.integrations.govly_client import GovlyAPIError, GovlyAuthenticationError, GovlyClient, GovlyRateLimitError
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    monkeypatch.setattr(govly_client.time, "sleep", lambda seconds: None)
+
+
+def _client(handler, **kwargs):
+    return GovlyClient(api_key="test-key", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_request_sends_auth_headers():
+    """Test requests carry the bearer token and hit the base URL"""
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"status": "ok"})
+
+    with _client(handler) as client:
+        assert client.health_check() is True
+
+    assert str(seen[0].url) == "https://api.govly.com/v1/health"
+    assert seen[0].headers["Authorization"] == "Bearer test-key"
+
+
+def test_retries_transient_errors():
+    """Test 5xx responses are retried before succeeding"""
+    statuses = iter([503, 502, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, json={"data": [{"id": "v1"}]} if status == 200 else {})
+
+    with _client(handler) as client:
+        assert client.get_contract_vehicles() == [{"id": "v1"}]
+
+
+def test_rate_limit_after_retries_exhausted():
+    """Test persistent 429s surface as GovlyRateLimitError with Retry-After"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "7"})
+
+    with _client(handler, max_retries=2) as client:
+        with pytest.raises(GovlyRateLimitError) as exc:
+            client._request("GET", "/opportunities")
+
+    assert exc.value.retry_after == 7
+    assert len(calls) == 3
+
+
+def test_rate_limit_with_http_date_retry_after():
+    """Test an HTTP-date Retry-After still surfaces as GovlyRateLimitError"""
+    headers = {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+
+    with _client(lambda request: httpx.Response(429, headers=headers), max_retries=0) as client:
+        with pytest.raises(GovlyRateLimitError) as exc:
+            client._request("GET", "/opportunities")
+
+    assert exc.value.retry_after == 60
+
+
+def test_error_statuses():
+    """Test auth failures and other 4xx map to client exceptions"""
+    with _client(lambda request: httpx.Response(401)) as client:
+        with pytest.raises(GovlyAuthenticationError):
+            client._request("GET", "/opportunities")
+
+    with _client(lambda request: httpx.Response(404, text="missing")) as client:
+        with pytest.raises(GovlyAPIError, match="404"):
+            client._request("GET", "/opportunities")
+
+
+def test_timeout_maps_to_api_error():
+    """Test transport timeouts raise GovlyAPIError"""
+
+    def handler(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    with _client(handler, timeout=5) as client:
+        with pytest.raises(GovlyAPIError, match="timeout after 5s"):
+            client._request("GET", "/opportunities")
+
+
+def test_throttles_when_remaining_budget_low(monkeypatch):
+    """Test a low X-RateLimit-Remaining delays the next request"""
+    sleeps = []
+    monkeypatch.setattr(govly_client.time, "sleep", sleeps.append)
+
+    def handler(request):
+        return httpx.Response(200, json={"data": []}, headers={"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "5"})
+
+    with _client(handler) as client:
+        client._request("GET", "/opportunities")
+        assert sleeps == []
+        client._request("GET", "/opportunities")
+
+    assert len(sleeps) == 1 and sleeps[0] > 59
+
+
+def test_backoff_gap_grows_and_recovers():
+    """Test failures double the request gap and successes shrink it"""
+    statuses = iter([503, 503, 200, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={})
+
+    with _client(handler) as client:
+        client._request("GET", "/agencies")
+        assert client._min_gap == 0.25
+        client._request("GET", "/agencies")
+        assert client._min_gap == 0.0
+
+
+def test_reference_data_cached(monkeypatch):
+    """Test vehicles are served from cache until refresh or expiry"""
+    calls = []
+    clock = [1000.0]
+    monkeypatch.setattr(govly_client.time, "monotonic", lambda: clock[0])
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"vehicles": [{"id": "SEWP"}]})
+
+    with _client(handler) as client:
+        assert client.get_contract_vehicles() == [{"id": "SEWP"}]
+        assert client.get_contract_vehicles() == [{"id": "SEWP"}]
+        assert len(calls) == 1
+
+        client.get_contract_vehicles(refresh=True)
+        assert len(calls) == 2
+
+        clock[0] += 3601
+        client.get_contract_vehicles()
+        assert len(calls) == 3
+
+
+def test_cache_respects_max_age(monkeypatch):
+    """Test Cache-Control max-age overrides the default TTL"""
+    calls = []
+    clock = [1000.0]
+    monkeypatch.setattr(govly_client.time, "monotonic", lambda: clock[0])
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"agencies": []}, headers={"Cache-Control": "public, max-age=10"})
+
+    with _client(handler) as client:
+        client.get_agencies()
+        clock[0] += 5
+        client.get_agencies()
+        assert len(calls) == 1
+        clock[0] += 6
+        client.get_agencies()
+        assert len(calls) == 2
+
+
+def test_get_opportunities_bulk_chunks_ids():
+    """Test bulk fetch issues one request per chunk of IDs"""
+    seen = []
+
+    def handler(request):
+        ids = request.url.params["ids"].split(",")
+        seen.append(ids)
+        return httpx.Response(200, json={"opportunities": [{"id": i} for i in ids]})
+
+    with _client(handler) as client:
+        result = client.get_opportunities_bulk([f"o{i}" for i in range(5)], chunk_size=2)
+
+    assert seen == [["o0", "o1"], ["o2", "o3"], ["o4"]]
+    assert [o["id"] for o in result] == [f"o{i}" for i in range(5)]
+
+
+def test_get_opportunities_bulk_drops_unrequested_rows(caplog):
+    """Test rows for IDs that were not requested are filtered out and logged"""
+
+    def handler(request):
+        return httpx.Response(200, json={"opportunities": [{"id": "o1"}, {"id": "recent-1"}, {"title": "no id"}]})
+
+    with _client(handler) as client:
+        result = client.get_opportunities_bulk(["o1", "o2"])
+
+    assert result == [{"id": "o1"}]
+    assert "2 unrequested opportunities" in caplog.text
+
+
+def test_iter_opportunities_pages_until_short_page():
+    """Test iteration advances the offset and keeps one pinned since window"""
+    seen = []
+
+    def handler(request):
+        params = request.url.params
+        seen.append((int(params["offset"]), params.get("since")))
+        count = 2 if int(params["offset"]) < 4 else 1
+        return httpx.Response(200, json={"opportunities": [{"id": f"{params['offset']}-{i}"} for i in range(count)]})
+
+    with _client(handler) as client:
+        ids = [o["id"] for o in client.iter_opportunities(since_hours=24, page_size=2)]
+        limited = list(client.iter_opportunities(page_size=2, max_pages=1))
+
+    assert ids == ["0-0", "0-1", "2-0", "2-1", "4-0"]
+    assert [offset for offset, _ in seen[:3]] == [0, 2, 4]
+    assert len({since for _, since in seen[:3]}) == 1
+    assert len(limited) == 2
+
+
+def test_since_window_bucketed_by_minute(monkeypatch):
+    """Test the since filter is stable within a minute and trails by since_hours"""
+    clock = [1_700_000_000.0]  # 2023-11-14T22:13:20Z
+    monkeypatch.setattr(govly_client.time, "time", lambda: clock[0])
+
+    first = govly_client._since(24)
+    clock[0] += 30
+    assert govly_client._since(24) == first == "2023-11-13T22:13:00Z"
+    clock[0] += 60
+    assert govly_client._since(24) == "2023-11-13T22:14:00Z"
+
+
+def test_invalid_json_maps_to_api_error():
+    """Test a non-JSON body raises GovlyAPIError"""
+    with _client(lambda request: httpx.Response(200, content=b"<html>")) as client:
+        with pytest.raises(GovlyAPIError, match="Invalid JSON"):
+            client._request("GET", "/opportunities")
+
+
+def test_fallback_endpoints_discovered_once():
+    """Test /contracts and the missing /health are only probed on first use"""
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.endswith("/contracts"):
+            return httpx.Response(200, json={"contracts": [{"id": "c1"}]})
+        return httpx.Response(404, text="not found")
+
+    with _client(handler) as client:
+        assert client.fetch_opportunities(limit=1) == [{"id": "c1"}]
+        assert client.fetch_opportunities(limit=1) == [{"id": "c1"}]
+        assert client.health_check() is True
+        assert client.health_check(refresh=True) is True
+
+    assert paths == [
+        "/v1/opportunities",
+        "/v1/contracts",
+        "/v1/contracts",
+        "/v1/health",
+        "/v1/contracts",
+        "/v1/contracts",
+    ]
+
+
+def test_retry_backoff_jittered_with_retry_after_floor(monkeypatch):
+    """Test retry delays are jittered within bounds and honour Retry-After"""
+    sleeps = []
+    monkeypatch.setattr(govly_client.time, "sleep", sleeps.append)
+    rate_limited = httpx.Response(429, headers={"Retry-After": "45"})
+    responses = iter([httpx.Response(503), httpx.Response(503), rate_limited, httpx.Response(200, json={})])
+
+    with _client(lambda request: next(responses)) as client:
+        monkeypatch.setattr(client, "_wait_if_throttled", lambda: None)
+        client._request("GET", "/agencies")
+
+    assert 1.0 <= sleeps[0] <= 3.0
+    assert 1.0 <= sleeps[1] <= 30.0
+    assert sleeps[2] == 45
+
+
+def test_post_retries_reuse_idempotency_key():
+    """Test a retried POST sends the same Idempotency-Key on every attempt"""
+    keys = []
+    statuses = iter([503, 200, 200])
+
+    def handler(request):
+        keys.append(request.headers.get("Idempotency-Key"))
+        return httpx.Response(next(statuses), json={})
+
+    with _client(handler) as client:
+        client._request("POST", "/opportunities/search", json={"q": "x"})
+        client._request("GET", "/agencies")
+
+    assert keys[0] and keys[0] == keys[1]
+    assert keys[2] is None
@@ -0,0 +1,161 @@
+"""Tests for the Govly sync service"""
+
+import json
+import time
+
+import pytest
+
+from mcp.integrations.govly_client import GovlyClient
+from mcp.services.govly_sync import GovlySyncService
+
+
+class FakeClient:
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def iter_opportunities(self, since_hours, page_size, max_pages=None):
+        yield from self.batches.pop(0)
+
+    def close(self):
+        pass
+
+
+class EndlessClient(GovlyClient):
+    """Client whose listing always returns a full page, optionally ignoring offset."""
+
+    def __init__(self, ignore_offset):
+        super().__init__(api_key="test-key")
+        self.ignore_offset = ignore_offset
+        self.calls = 0
+
+    def fetch_opportunities(self, limit=50, offset=0, **filters):
+        self.calls += 1
+        start = 0 if self.ignore_offset else offset
+        return [{"id": f"E{start + i}"} for i in range(limit)]
+
+
+@pytest.fixture
+def service(tmp_path):
+    state_file = tmp_path / "state.json"
+    state_file.write_text(json.dumps({"opportunities": [{"id": "govly_existing"}], "recent_actions": []}))
+    svc = GovlySyncService(api_key="test-key", state_file=str(state_file))
+    return svc
+
+
+def _state(svc):
+    return json.loads(svc.state_file.read_text())
+
+
+def test_sync_appends_only_new_opportunities(service):
+    """Test known IDs are skipped and only new rows land in state"""
+    service._client = FakeClient([[{"id": "existing"}, {"id": "A1", "title": "New"}, {"id": "A1"}]])
+
+    result = service.sync_now()
+
+    assert result["success"] and result["new_opportunities"] == 1
+    assert [o["id"] for o in _state(service)["opportunities"]] == ["govly_existing", "govly_a1"]
+
+
+def test_sync_stops_when_endpoint_ignores_offset(service):
+    """Test a listing that repeats the same full page ends after one page"""
+    service._client = EndlessClient(ignore_offset=True)
+
+    result = service.sync_now()
+
+    assert result["success"] and result["new_opportunities"] == 200
+    assert service._client.calls == 2
+
+
+def test_sync_caps_pages_per_run(service):
+    """Test full pages of new opportunities stop at max_pages"""
+    service.max_pages = 3
+    service._client = EndlessClient(ignore_offset=False)
+
+    result = service.sync_now()
+
+    assert result["success"] and result["new_opportunities"] == 600
+    assert service._client.calls == 3
+
+
+def test_sync_without_new_ids_skips_state_io(service, monkeypatch):
+    """Test a sync with only known IDs never reloads state.json"""
+    service._client = FakeClient([[{"id": "existing"}]])
+    monkeypatch.setattr(service, "_load_state", lambda: pytest.fail("state reloaded"))
+
+    assert service.sync_now()["new_opportunities"] == 0
+
+
+def test_sync_picks_up_webhook_ids(service):
+    """Test IDs written to state.json by webhooks after startup are not duplicated"""
+    state = _state(service)
+    state["opportunities"].append({"id": "govly_b2"})
+    service.state_file.write_text(json.dumps(state))
+    service._client = FakeClient([[{"id": "B2"}]])
+
+    assert service.sync_now()["new_opportunities"] == 0
+    assert len(_state(service)["opportunities"]) == 2
+
+
+def test_corrupt_state_falls_back_to_empty(tmp_path):
+    """Test an unreadable state.json loads as an empty state"""
+    state_file = tmp_path / "state.json"
+    state_file.write_text("{not json")
+    svc = GovlySyncService(api_key="test-key", state_file=str(state_file))
+
+    assert svc._load_state() == {"opportunities": [], "recent_actions": []}
+
+
+def test_generate_id_stable_without_external_id(service):
+    """Test content-hashed IDs ignore case/whitespace and are reproducible"""
+    opp = {"title": "Network Refresh ", "posted_date": "2025-10-01", "agency": "DISA"}
+
+    opp_id = service._generate_id(opp)
+
+    assert opp_id == service._generate_id({**opp, "title": "network refresh"})
+    assert opp_id != service._generate_id({**opp, "agency": "Army"})
+    assert opp_id == "govly_" + GovlySyncService._content_hash(opp)
+    assert len(opp_id) == len("govly_") + 16
+
+
+def test_sync_batch_shares_created_at(service):
+    """Test rows added in one sync share a single created_at timestamp"""
+    service._client = FakeClient([[{"id": "C1"}, {"id": "C2"}]])
+    service.sync_now()
+
+    created = {o["created_at"] for o in _state(service)["opportunities"] if o["id"] != "govly_existing"}
+    assert len(created) == 1
+
+
+def test_stop_interrupts_sync_interval(service):
+    """Test stop() wakes the loop instead of waiting out the interval"""
+    service._client = FakeClient([[]])
+    service.sync_interval = 3600
+    service.start()
+    while service.sync_count == 0:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    service.stop()
+
+    assert time.monotonic() - started < 5
+    assert not service.thread.is_alive()
+
+
+def test_calculate_fy(service):
+    """Test federal FY routing from ISO close dates"""
+    assert service._calculate_fy("2025-09-30T23:59:59Z") == "FY2025"
+    assert service._calculate_fy("2025-10-01T00:00:00Z") == "FY2026"
+    assert service._calculate_fy("2026-03-15") == "FY2026"
+    assert service._calculate_fy("not a date") is None
+    assert service._calculate_fy(None) is None
+
+
+def test_stop_releases_client(service):
+    """Test stop() closes the client so a restart builds a new one"""
+    service._client = FakeClient([[]])
+    service.start()
+    while service.sync_count == 0:
+        time.sleep(0.01)
+    service.stop()
+
+    assert service._client is None
@@ -0,0 +1,126 @@
+"""Tests for partner relationship graph analytics"""
+
+from mcp.core.partner_graph import PartnerNode, PartnerRelationship, build_partner_graph
+
+
+def _records():
+    return [
+        {"name": "Alpha", "tier": "Gold", "oem": "Cisco", "program": "Cisco PTP"},
+        {"name": "Bravo", "tier": "gold", "oem": "Cisco", "program": "Cisco PTP"},
+        {"name": "Charlie", "tier": "Silver", "oem": "Nutanix", "program": "Nutanix Elevate"},
+    ]
+
+
+def test_distributions():
+    """Test OEM and tier distributions"""
+    graph = build_partner_graph(_records())
+
+    assert graph.get_oem_distribution() == {"Cisco": 2, "Nutanix": 1}
+    assert graph.get_tier_distribution() == {"gold": 2, "silver": 1}
+
+
+def test_distributions_refresh_after_add_node():
+    """Test distribution caches are invalidated when nodes are added"""
+    graph = build_partner_graph(_records())
+    graph.get_oem_distribution()["Cisco"] = 99  # returned copy must not leak into cache
+    assert graph.get_oem_distribution()["Cisco"] == 2
+
+    graph.add_node(PartnerNode(name="Delta", tier="Bronze", oem="Dell", program="Dell Partner"))
+
+    assert graph.get_oem_distribution()["Dell"] == 1
+    assert graph.get_tier_distribution()["bronze"] == 1
+
+
+def test_connected_components():
+    """Test connected components group partners with their OEMs"""
+    graph = build_partner_graph(_records())
+    components = graph.get_connected_components()
+
+    assert len(components) == 2
+    assert components[0] == {"Alpha", "Bravo", "Cisco"}
+    assert components[1] == {"Charlie", "Nutanix"}
+
+
+def test_connected_components_large_chain():
+    """Test long chains do not hit the recursion limit"""
+    records = [{"name": f"P{i}", "tier": "Gold", "oem": f"OEM{i // 2}", "program": f"Prog{(i + 1) // 2}"} for i in range(1500)]
+    graph = build_partner_graph(records)
+
+    assert len(graph.get_connected_components()) == 1
+
+
+def test_neighbors_and_clustering():
+    """Test neighbor lookups and clustering coefficient"""
+    records = _records() + [{"name": "Delta", "tier": "Gold", "oem": "Cisco", "program": "Cisco PTP"}]
+    graph = build_partner_graph(records)
+
+    assert graph.get_neighbors("Alpha") == ["Cisco", "Bravo", "Delta"]
+    assert graph.get_degree("Alpha") == 3
+    # Pairs are checked in neighbor order against the directed adjacency, so the
+    # one-way partner->OEM edges do not count; only Bravo-Delta is linked
+    assert graph.get_clustering_coefficient("Alpha") == 1 / 3
+    assert graph.get_clustering_coefficient("Charlie") == 0.0
+
+
+def test_to_adjacency_list():
+    """Test adjacency export lists outgoing edges per partner node"""
+    graph = build_partner_graph(_records())
+    adj = graph.to_adjacency_list()
+
+    assert list(adj) == ["Alpha", "Bravo", "Charlie"]
+    assert [e["target"] for e in adj["Alpha"]] == ["Cisco", "Bravo"]
+    assert adj["Bravo"] == [{"target": "Cisco", "type": "partner_oem", "weight": 1.0}]
+    assert "Cisco" not in adj
+
+
+def test_node_strings_interned():
+    """Test low-cardinality node fields share a single string object"""
+    a = PartnerNode(name="A", tier="".join(["Go", "ld"]), oem="Cisco", program="PTP")
+    b = PartnerNode(name="B", tier="".join(["Gol", "d"]), oem="Cisco", program="PTP")
+
+    assert a.tier is b.tier
+
+
+def test_analytics_cache_invalidated_on_change():
+    """Test memoized analytics are recomputed after structural changes"""
+    graph = build_partner_graph(_records())
+    assert graph.get_degree_centrality("Charlie") == 0.5
+    assert [n.name for n in graph.get_partners_by_tier("GOLD")] == ["Alpha", "Bravo"]
+
+    graph.add_node(PartnerNode(name="Delta", tier="Gold", oem="Nutanix", program="Nutanix Elevate"))
+    graph.add_edge(PartnerRelationship(source="Charlie", target="Delta", relationship_type="partner_partner"))
+
+    assert graph.get_degree_centrality("Charlie") == 2 / 3
+    assert [n.name for n in graph.get_partners_by_tier("gold")] == ["Alpha", "Bravo", "Delta"]
+
+
+def test_analytics_matches_single_node_getters():
+    """Test bulk analytics agrees with per-node getters"""
+    graph = build_partner_graph(_records())
+    metrics = graph.analytics()
+
+    assert set(metrics) == {"Alpha", "Bravo", "Charlie"}
+    for name, values in metrics.items():
+        assert values["degree"] == graph.get_degree(name)
+        assert values["degree_centrality"] == graph.get_degree_centrality(name)
+        assert values["clustering_coefficient"] == graph.get_clustering_coefficient(name)
+
+
+def test_replacing_node_updates_indexes():
+    """Test re-adding a node moves it between OEM and tier indexes"""
+    graph = build_partner_graph(_records())
+    graph.add_node(PartnerNode(name="Charlie", tier="Gold", oem="Cisco", program="Cisco PTP"))
+
+    assert [n.name for n in graph.get_partners_by_oem("Cisco")] == ["Alpha", "Bravo", "Charlie"]
+    assert graph.get_partners_by_oem("Nutanix") == []
+    assert graph.get_oem_distribution() == {"Cisco": 3}
+    assert graph.get_tier_distribution() == {"gold": 3}
+
+
+def test_all_degree_centrality():
+    """Test bulk degree centrality matches the single-node getter"""
+    graph = build_partner_graph(_records())
+    centrality = graph.all_degree_centrality()
+
+    assert centrality == {"Alpha": 1.0, "Bravo": 1.0, "Charlie": 0.5}
+    assert all(graph.get_degree_centrality(name) == value for name, value in centrality.items())
@@ -2,11 +2,13 @@
 
 import json
 import os
+from pathlib import Path
 
 import pytest
 from httpx import AsyncClient
 
 from mcp.api.main import app
+from mcp.core import partners_sync
 from mcp.core.partners_sync import PartnerTierRecord, PartnerTierSync
 
 
@@ -182,6 +184,26 @@ def test_apply_updates_write(temp_store, tmp_path):
     assert store_data[0]["name"] == "Test Partner"
 
 
+def test_load_store_cache(temp_store):
+    """Test store parse is reused until the file changes"""
+    sync = PartnerTierSync(store_path=str(temp_store))
+    assert sync._load_store() == []
+    assert partners_sync._STORE_CACHE[temp_store.resolve()][1] == []
+
+    records = [PartnerTierRecord(name="Test Partner", tier="Gold", program="Test Program", oem="Cisco")]
+    sync.apply_updates(sync.plan_updates(records), dry_run=False)
+
+    # A fresh instance (as the API handlers create per request) shares the cache
+    other = PartnerTierSync(store_path=str(temp_store))
+    loaded = other._load_store()
+    assert [p["name"] for p in loaded] == ["Test Partner"]
+    loaded[0]["name"] = "Mutated"
+    assert [p["name"] for p in sync._load_store()] == ["Test Partner"]
+
+    temp_store.write_text("[]\n\n")
+    assert sync._load_store() == []
+
+
 def test_export_obsidian(temp_store, temp_vault, tmp_path):
     """Test Obsidian markdown export"""
     # Create store with data
@@ -229,6 +251,30 @@ def test_export_obsidian(temp_store, temp_vault, tmp_path):
     assert "John Doe" in cisco_content
 
 
+def test_export_obsidian_mixed_oem_values(temp_store, temp_vault):
+    """Test export tolerates records with a null or missing OEM"""
+    base = {"tier": "Gold", "program": "PTP"}
+    test_data = [
+        {**base, "name": "P1", "oem": "Cisco"},
+        {**base, "name": "P2", "oem": None},
+        {**base, "name": "P3"},
+        {**base, "name": "P4", "oem": "Cisco"},
+    ]
+    temp_store.write_text(json.dumps(test_data))
+
+    result = PartnerTierSync(vault_root=temp_vault, store_path=str(temp_store)).export_obsidian()
+
+    oems_dir = temp_vault / "30 Hubs" / "OEMs"
+    assert result["oems_count"] == 2
+    assert sorted(Path(f).name for f in result["files_written"]) == ["Cisco.md", "Unknown.md"]
+    assert not (oems_dir / ".md").exists()
+    cisco_content = (oems_dir / "Cisco.md").read_text()
+    assert "P1" in cisco_content and "P4" in cisco_content
+    unknown_content = (oems_dir / "Unknown.md").read_text()
+    assert unknown_content.startswith("# Unknown\n")
+    assert "P2" in unknown_content and "P3" in unknown_content
+
+
 @pytest.mark.asyncio
 async def test_partners_endpoints_contract():
     """Test API endpoints basic contract"""
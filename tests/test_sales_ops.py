@@ -0,0 +1,116 @@
+"""Tests for sales operations helpers"""
+
+from mcp.core.sales_ops import (
+    PartnerIndex,
+    calculate_partner_coverage_score,
+    enrich_forecast_with_partners,
+    get_partner_recommendations,
+    inject_partner_context_to_reasoning,
+    prepare_crm_export_payload,
+    summarize_account_context,
+)
+
+PARTNER_SCORES = [
+    {"name": "Alpha", "tier": "Gold", "oem": "Cisco", "strength_score": 80.0, "capabilities": ["networking"]},
+    {"name": "Bravo", "tier": "Silver", "oem": "Cisco", "strength_score": 60.0},
+    {"name": "Charlie", "tier": "Gold", "oem": "Dell", "strength_score": 90.0},
+    {"name": "Alpha", "tier": "Bronze", "oem": "Dell", "strength_score": 10.0},  # duplicate name, ignored
+]
+
+
+def test_enrich_forecast_with_partners():
+    """Test forecast enrichment with matching partner scores"""
+    forecast = {
+        "opportunities": [
+            {"id": "o1", "partner_attribution": ["Alpha", "Unknown"]},
+            {"id": "o2", "partner_attribution": ["Bravo", "Alpha"]},
+        ]
+    }
+    enriched = enrich_forecast_with_partners(forecast, PARTNER_SCORES)
+    context = enriched["partner_context"]
+
+    assert context["engaged_partners"] == 2
+    assert sorted(p["name"] for p in context["partners"]) == ["Alpha", "Bravo"]
+    assert context["avg_partner_strength"] == 70.0
+    assert "partner_context" not in forecast
+
+
+def test_enrich_forecast_without_partners():
+    """Test forecasts with no partner attribution get an empty partner context"""
+    forecast = {"opportunities": [{"id": "o1"}, {"id": "o2", "partner_attribution": []}]}
+    enriched = enrich_forecast_with_partners(forecast, PARTNER_SCORES)
+
+    assert enriched["partner_context"] == {"engaged_partners": 0, "partners": [], "avg_partner_strength": 0.0}
+
+
+def test_summarize_account_context():
+    """Test account summary with engaged partners"""
+    opportunities = [
+        {"name": "a", "amount": 100.0, "partner_attribution": ["Charlie"]},
+        {"name": "b", "amount": 300.0, "partner_attribution": ["Alpha"]},
+    ]
+    summary = summarize_account_context("Acme", opportunities, PARTNER_SCORES)
+
+    assert summary["total_pipeline"] == 400.0
+    assert summary["partner_strength_avg"] == 85.0
+    assert [o["name"] for o in summary["top_opportunities"]] == ["b", "a"]
+
+
+def test_summarize_account_context_top_five():
+    """Test top opportunities keep the five largest, ties in input order"""
+    opportunities = [{"name": str(i), "amount": amount} for i, amount in enumerate([5, 50, 20, 50, 1, 30, 20])]
+    summary = summarize_account_context("Acme", opportunities, PARTNER_SCORES)
+
+    assert [o["name"] for o in summary["top_opportunities"]] == ["1", "3", "5", "2", "6"]
+
+
+def test_calculate_partner_coverage_score():
+    """Test coverage score uses first matching score per partner"""
+    opportunity = {"partner_attribution": ["Alpha", "Charlie", "Missing"]}
+
+    assert calculate_partner_coverage_score(opportunity, PARTNER_SCORES) == 95.0
+    assert calculate_partner_coverage_score({"partner_attribution": []}, PARTNER_SCORES) == 0.0
+
+
+def test_partner_index_shared_across_helpers():
+    """Test helpers accept a prebuilt PartnerIndex with the same results"""
+    index = PartnerIndex(PARTNER_SCORES)
+    opportunity = {"oem": "Cisco", "partner_attribution": ["Alpha", "Charlie"]}
+
+    assert calculate_partner_coverage_score(opportunity, index) == calculate_partner_coverage_score(opportunity, PARTNER_SCORES)
+    recommendations = get_partner_recommendations(opportunity, index)
+    assert [r["name"] for r in recommendations] == ["Alpha", "Bravo"]
+    assert get_partner_recommendations(opportunity, PARTNER_SCORES) == recommendations
+    assert [p["name"] for p in index.by_oem["Cisco"]] == ["Alpha", "Bravo"]
+
+
+def test_prepare_crm_export_payload():
+    """Test CRM export matches attribution by id, falling back to name"""
+    opportunities = [
+        {"id": "o1", "name": "First", "amount": 100.0, "stage": "Proposal"},
+        {"name": "o2", "amount": 50.0},
+    ]
+    attribution = [{"opportunity_id": "o1", "partner_pool": 20.0}, {"opportunity_id": "o2", "partner_pool": 10.0}]
+    payload = prepare_crm_export_payload(opportunities, attribution)
+
+    first, second = payload["opportunities"]
+    assert first["attribution"]["partner_pool"] == 20.0
+    assert first["crm_stage"] == "Proposal"
+    assert second["attribution"]["partner_pool"] == 10.0
+    assert second["crm_stage"] == "Unknown"
+    assert "attribution" not in opportunities[0]
+    assert payload["summary"] == {"total_opportunities": 2, "total_pipeline": 150.0, "with_attribution": 2}
+
+
+def test_inject_partner_context_to_reasoning():
+    """Test reasoning lists up to three strongest partners"""
+    partners = [
+        {"name": "A", "tier": "Gold", "strength_score": 50.0},
+        {"name": "B", "tier": "Silver", "strength_score": 90.0},
+        {"name": "C", "tier": "Gold", "strength_score": 70.0},
+        {"name": "D", "tier": "Bronze", "strength_score": 10.0},
+    ]
+    text = inject_partner_context_to_reasoning("Base", {"partners": partners, "avg_partner_strength": 55.0})
+
+    assert text == "Base\n\nPartner Context: 4 engaged partners (avg strength: 55.0/100). Key partners: B (Silver), C (Gold), A (Gold)."
+    assert inject_partner_context_to_reasoning("Base", {"partners": []}) == "Base"
@@ -119,6 +119,12 @@ class TestPartnerFitScoring:
         score = scorer.calculate_partner_fit_score(["Microsoft Partner"], ["Microsoft"])
         assert score >= 70.0  # Should have alignment bonus
 
+    def test_partner_oem_alignment_capped(self, scorer):
+        """Test alignment bonus counts each aligned pair and caps at +20."""
+        assert scorer.calculate_partner_fit_score(["Cisco Partner"], ["cisco", "Dell"]) == 70.0
+        assert scorer.calculate_partner_fit_score(["Cisco Partner"], ["cisco", "CISCO Partner Inc", "Dell"]) == 80.0
+        assert scorer.calculate_partner_fit_score(["Cisco", "Dell"], ["cisco", "dell", "Cisco"]) == 90.0
+
 
 class TestGovlyRelevanceScoring:
     """Test Govly relevance scoring logic."""
@@ -143,6 +149,11 @@ class TestGovlyRelevanceScoring:
         score = scorer.calculate_govly_relevance_score(["federal", "agency", "dod"], "Direct")
         assert score >= 70.0  # Should accumulate bonuses
 
+    def test_tag_with_several_keywords(self, scorer):
+        """Test each government keyword within a tag adds to the bonus."""
+        assert scorer.calculate_govly_relevance_score(["DoD Civilian"], "Direct") == 70.0
+        assert scorer.calculate_govly_relevance_score(["commercial"], "Direct") == 50.0
+
 
 class TestAmountScoring:
     """Test deal amount scoring logic."""
@@ -172,6 +183,13 @@ class TestAmountScoring:
         score = scorer.calculate_amount_score(50000000)
         assert score == 100.0
 
+    def test_band_edges(self, scorer):
+        """Test amounts exactly on a threshold fall into the upper band."""
+        assert scorer.calculate_amount_score(9999.99) == 20.0
+        assert scorer.calculate_amount_score(10000) == 40.0
+        assert scorer.calculate_amount_score(10000000) == 100.0
+        assert scorer.calculate_amount_score(-5) == 0.0
+
 
 class TestStageProbability:
     """Test stage probability calculations."""
@@ -206,6 +224,12 @@ class TestStageProbability:
         prob = scorer.calculate_stage_probability("Unknown Stage")
         assert prob == 0.20
 
+    def test_stage_case_and_substring(self, scorer):
+        """Test lowercase and embedded stage names match like canonical names."""
+        assert scorer.calculate_stage_probability("negotiation") == 0.75
+        assert scorer.calculate_stage_probability("Late Proposal Review") == 0.45
+        assert scorer.calculate_stage_probability("Late Proposal Review") == 0.45
+
 
 class TestTimeDecayFactor:
     """Test time decay factor calculations."""
@@ -326,6 +350,46 @@ class TestCompositeScore:
         assert scores["win_prob"] < 50.0
 
 
+class TestSharedScorer:
+    """Test the shared scorer instance."""
+
+    def test_instance_returns_module_scorer(self):
+        """Test instance() hands back the module-level scorer."""
+        from mcp.core.scoring import scorer as module_scorer
+
+        assert OpportunityScorer.instance() is module_scorer
+        assert OpportunityScorer.instance() is OpportunityScorer.instance()
+
+
+class TestBatchScoring:
+    """Test batch scoring."""
+
+    def test_score_batch_matches_single(self, scorer, sample_opportunity):
+        """Test that batch scoring matches per-opportunity scoring."""
+        opportunities = [sample_opportunity, {"id": "minimal"}, {"oems": "Cisco", "amount": 750000, "region": "East"}]
+
+        batch = scorer.score_batch(opportunities, include_reasoning=True)
+
+        assert len(batch) == len(opportunities)
+        assert len({s["scored_at"] for s in batch}) == 1
+        for opp, batch_scores in zip(opportunities, batch):
+            single = scorer.calculate_composite_score(opp, include_reasoning=True)
+            single.pop("scored_at")
+            assert {k: v for k, v in batch_scores.items() if k != "scored_at"} == single
+
+    def test_score_batch_as_results(self, scorer, sample_opportunity):
+        """Test batch scoring can return unrounded ScoreResult objects."""
+        results = scorer.score_batch([sample_opportunity], as_results=True)
+        expected = scorer.score_batch([sample_opportunity])[0]
+
+        as_dict = results[0].to_dict()
+        as_dict.pop("scored_at")
+        expected.pop("scored_at")
+        assert as_dict == expected
+        assert results[0].score_reasoning is None
+        assert round(results[0].win_prob, 2) == expected["win_prob"]
+
+
 class TestConfidenceInterval:
     """Test confidence interval calculations."""
 
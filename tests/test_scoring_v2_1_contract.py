@@ -144,6 +144,24 @@ class TestScoringV21Features:
         assert retrieved["oem_alignment"] == 92.0
         assert "scored_at" in retrieved
 
+    def test_feature_store_flush(self, tmp_path):
+        """Test that stored features can be flushed to JSONL."""
+        import json
+
+        from mcp.core.scoring import flush_feature_store, save_features
+
+        save_features("test_flush", {"oem_alignment": 88.0})
+        path = tmp_path / "feature_store.jsonl"
+
+        written = flush_feature_store(str(path))
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert written == len(records)
+        record = next(r for r in records if r["opportunity_id"] == "test_flush")
+        assert record["oem_alignment"] == 88.0
+        assert record["scored_at"].endswith("Z")
+        assert isinstance(record["scored_at_ns"], int)
+
 
 class TestScoringV21Compatibility:
     """Test v2.1 maintains compatibility with v2.0."""
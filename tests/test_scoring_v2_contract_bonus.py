@@ -135,6 +135,12 @@ class TestCustomerOrgBonus:
         assert "customer_org_bonus" in scores
         assert scores["customer_org_bonus"] == 2.0  # v2.1 Default tier
 
+    def test_org_bonus_civilian_keywords(self, scorer):
+        """Test civilian keywords match case-insensitively (v2.1: Civilian = 3%)."""
+        for org in ("Civilian Agency", "Federal Agency A"):
+            scores = scorer.calculate_composite_score({"oems": ["Cisco"], "amount": 500000, "customer_org": org})
+            assert scores["customer_org_bonus"] == 3.0
+
 
 class TestCombinedBonuses:
     """Test that bonuses combine correctly (v2.1)."""
@@ -0,0 +1,56 @@
+"""Tests for the JSON file store"""
+
+import json
+
+import pytest
+
+from mcp.core.store import read_json, write_json
+
+
+def test_write_then_read_round_trip(tmp_path):
+    """Test written data reads back unchanged and ends with a newline"""
+    path = tmp_path / "nested" / "state.json"
+    data = {"name": "Acme", "amount": 1234.5, "tags": ["a", "b"], "meta": {"count": 3, "none": None}}
+
+    write_json(str(path), data)
+
+    assert read_json(str(path)) == data
+    assert path.read_text().endswith("}\n")
+    assert list(tmp_path.joinpath("nested").iterdir()) == [path]
+
+
+def test_write_json_stringifies_int_keys(tmp_path):
+    """Test non-string keys are written the way stdlib json writes them"""
+    path = tmp_path / "state.json"
+
+    write_json(str(path), {1: "one"})
+
+    assert read_json(str(path)) == {"1": "one"}
+
+
+def test_write_json_large_int_falls_back(tmp_path):
+    """Test integers too large for orjson still serialize"""
+    path = tmp_path / "state.json"
+
+    write_json(str(path), {"big": 2**70})
+
+    assert read_json(str(path)) == {"big": 2**70}
+
+
+def test_write_json_rejects_unserializable(tmp_path):
+    """Test unserializable data raises and leaves no file behind"""
+    path = tmp_path / "state.json"
+
+    with pytest.raises(TypeError):
+        write_json(str(path), {"bad": object()})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_json_invalid(tmp_path):
+    """Test invalid JSON raises JSONDecodeError"""
+    path = tmp_path / "state.json"
+    path.write_text("{not json")
+
+    with pytest.raises(json.JSONDecodeError):
+        read_json(str(path))
@@ -0,0 +1,73 @@
+"""Tests for unified vault export"""
+
+from mcp.core.vault_export import VaultExporter, preview_sync_operations
+
+
+def test_export_batch_shares_timestamp(tmp_path):
+    """Test batch export writes every opportunity with one updated timestamp"""
+    exporter = VaultExporter(str(tmp_path))
+    paths = exporter.export_batch(
+        [
+            {"name": "Opp A", "amount": 1000, "close_date": "2025-11-15", "partner_attribution": ["Alpha"]},
+            {"name": "Opp B", "amount": 2000},
+        ]
+    )
+
+    assert [p.name for p in paths] == ["Opp A.md", "Opp B.md"]
+    assert paths[0].parent.name == "FY26"
+    assert paths[1].parent.name == "Triage"
+    updated = {line for p in paths for line in p.read_text().splitlines() if line.startswith("updated:")}
+    assert len(updated) == 1
+    assert "- [[Alpha]]" in paths[0].read_text()
+
+
+def test_export_partner_uses_given_timestamp(tmp_path):
+    """Test an explicit now_iso is written to the frontmatter"""
+    exporter = VaultExporter(str(tmp_path))
+    path = exporter.export_partner({"name": "Alpha", "oem": "Cisco"}, {"strength_score": 80.0}, now_iso="2025-01-01T00:00:00+00:00")
+
+    content = path.read_text()
+    assert 'updated: "2025-01-01T00:00:00+00:00"' in content
+    assert "| Alpha |  |  | - | 80.0 |" in content
+
+
+def test_forecast_dashboard_top_opportunities(tmp_path):
+    """Test the dashboard lists the 20 highest win probabilities, ties in input order"""
+    exporter = VaultExporter(str(tmp_path))
+    opportunities = [{"name": f"o{i}", "amount": 1000, "win_prob": i % 10, "score_raw": 1.0} for i in range(40)]
+    path = exporter.export_forecast_dashboard({"opportunities": opportunities})
+
+    rows = [line for line in path.read_text().splitlines() if line.startswith("| [[")]
+    names = [row.split("]]")[0][4:] for row in rows]
+    assert names == [f"o{i}" for wp in range(9, -1, -1) for i in (wp, wp + 10, wp + 20, wp + 30)][:20]
+
+
+def test_overwrite_keeps_backup_of_previous_content(tmp_path):
+    """Test re-exporting snapshots the previous file unless backups are disabled"""
+    exporter = VaultExporter(str(tmp_path))
+    path = exporter.export_opportunity({"name": "Opp", "stage": "Discovery"})
+    exporter.export_opportunity({"name": "Opp", "stage": "Proposal"})
+
+    backups = list(path.parent.glob("Opp.bak.*"))
+    assert len(backups) == 1
+    assert "**Stage**: Discovery" in backups[0].read_text()
+    assert "**Stage**: Proposal" in path.read_text()
+
+    no_backup = VaultExporter(str(tmp_path / "other"), keep_backups=False)
+    other = no_backup.export_opportunity({"name": "Opp"})
+    no_backup.export_opportunity({"name": "Opp"})
+    assert list(other.parent.glob("Opp.bak.*")) == []
+
+
+def test_preview_sync_operations_lists_nested_markdown(tmp_path):
+    """Test preview finds markdown files in nested folders, matching rglob"""
+    exporter = VaultExporter(str(tmp_path), keep_backups=False)
+    paths = exporter.export_batch([{"name": "Opp A", "close_date": "2025-11-15"}, {"name": "Opp B"}])
+    (paths[1].parent / "notes.txt").write_text("ignored")
+
+    preview = preview_sync_operations(str(tmp_path), "opportunities")
+    opps_dir = paths[0].parent.parent
+
+    assert preview["existing_files"] == [p.name for p in opps_dir.rglob("*.md")]
+    assert sorted(preview["existing_files"]) == ["Opp A.md", "Opp B.md"]
+    assert preview_sync_operations(str(tmp_path), "partners")["existing_files"] == []